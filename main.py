@@ -10,38 +10,64 @@ Usage:
     python main.py init       - Initialize the database
 """
 
+from __future__ import annotations
+
 import asyncio
+import atexit
 import logging
+import queue
+import signal
 import sys
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import dataclass
-from typing import Optional
-
-import uvicorn
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from typing import TYPE_CHECKING, Optional
 
+from src.cache import invalidate as invalidate_cache
 from src.config import settings
-from src.database.models import init_db, SessionLocal, Ticker, Mention
-from src.scraper.twitter import TwitterScraper
-from src.scraper.pumpfun import PumpFunScraper, PumpFunToken
-from src.scraper.dexscreener import DexScreenerScraper, DexToken
-from src.analyzer.ticker import TickerAnalyzer
-from src.dashboard.app import app
-from src.bots.telegram_bot import TelegramBot
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(message)s",
-    datefmt="%d-%b-%y %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("trench_scan.log"),
-    ],
+from src.database.models import (
+    init_db,
+    insert_ignore,
+    increment_mention_counts,
+    SessionLocal,
+    Ticker,
+    Mention,
 )
+
+# Scrapers, the dashboard, the bot and their dependencies are imported where
+# they are used, so commands like `init` don't pay for imports they never touch
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from src.scraper.twitter import TwitterScraper, Tweet
+    from src.scraper.pumpfun import PumpFunScraper, PumpFunToken
+    from src.scraper.dexscreener import DexScreenerScraper
+
 logger = logging.getLogger(__name__)
 
 
+def setup_logging():
+    """
+    Send log records through a queue to the console and log file.
+
+    A listener thread does the writing, so the event loop never blocks on
+    log I/O. Called from main() rather than at import, so spawned worker
+    processes (which re-import this module) don't open the log file or start
+    listener threads of their own.
+    """
+    formatter = logging.Formatter("%(asctime)s - %(message)s", datefmt="%d-%b-%y %H:%M:%S")
+    handlers = [logging.StreamHandler(), logging.FileHandler("trench_scan.log")]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
 @dataclass
 class ViralToken:
     """Token with combined pump.fun + Twitter data"""
@@ -57,20 +83,54 @@ class ViralToken:
     pump_fun_data: Optional[PumpFunToken] = None
 
 
+# Set to shut down the long-running tasks (scheduler, bot, dashboard)
+_stop = asyncio.Event()
+
+
+# Scrapers are created once per process so their HTTP connection pools
+# (and TLS sessions) are reused across scrape cycles
+_scrapers: Optional[tuple[PumpFunScraper, DexScreenerScraper, TwitterScraper]] = None
+
+
+def get_scrapers() -> tuple[PumpFunScraper, DexScreenerScraper, TwitterScraper]:
+    """Get the shared scraper instances, creating them on first use"""
+    from src.scraper.twitter import TwitterScraper
+    from src.scraper.pumpfun import PumpFunScraper
+    from src.scraper.dexscreener import DexScreenerScraper
+
+    global _scrapers
+    if _scrapers is None:
+        _scrapers = (PumpFunScraper(), DexScreenerScraper(), TwitterScraper())
+    return _scrapers
+
+
+async def close_scrapers():
+    """Drop the shared scrapers and close the HTTP client they share"""
+    from src.scraper._http import close_client
+
+    global _scrapers
+    _scrapers = None
+    await close_client()
+
+
 async def run_scrape_cycle():
     """Run a single scrape and analysis cycle"""
+    from src.analyzer.ticker import TickerAnalyzer
+    from src.scraper.pumpfun import PumpFunToken
+
     logger.info("Starting scrape cycle...")
 
-    pumpfun = PumpFunScraper()
-    dexscreener = DexScreenerScraper()
-    twitter = TwitterScraper()
+    pumpfun, dexscreener, twitter = get_scrapers()
 
-    if not settings.rapidapi_key:
+    twitter_enabled = bool(settings.rapidapi_key)
+    if not twitter_enabled:
         logger.warning("RapidAPI key not configured - Twitter search disabled")
 
-    db = SessionLocal()
-
     try:
+        if settings.scrape_mode == "twitter":
+            await run_twitter_only_cycle(twitter)
+            return
+
         # Step 1: Get new tokens from pump.fun (last 6 hours)
         logger.info("Fetching new pump.fun launches...")
         new_tokens = await pumpfun.get_new_tokens(limit=100, max_age_hours=6)
@@ -105,133 +165,257 @@ async def run_scrape_cycle():
         if not new_tokens:
             logger.warning("No new tokens found from pump.fun or DexScreener")
             # Fall back to Twitter-only mode
-            await run_twitter_only_cycle(twitter, db)
+            await run_twitter_only_cycle(twitter)
             return
 
-        # Step 2: Search Twitter for mentions of these tokens
-        viral_tokens = []
-        now = datetime.now(timezone.utc)
-
-        for token in new_tokens:
-            # Skip tokens with invalid/missing data
-            if not token.address or not token.symbol or token.symbol == "???":
-                continue
-
-            # Calculate age in minutes
-            age_minutes = int((now - token.created_timestamp).total_seconds() / 60)
-
-            # Store token in database - look up by contract_address (unique per token)
-            db_ticker = db.query(Ticker).filter(Ticker.contract_address == token.address).first()
-
-            if not db_ticker:
-                # Also check if symbol exists (to avoid unique constraint error)
-                existing_symbol = db.query(Ticker).filter(Ticker.symbol == token.symbol).first()
-                if existing_symbol:
-                    # Symbol exists with different address - update address or skip
-                    logger.debug(f"Symbol ${token.symbol} already exists, skipping duplicate")
-                    continue
-
-                db_ticker = Ticker(
-                    symbol=token.symbol,
-                    contract_address=token.address,
-                    chain="solana",
-                    first_seen=token.created_timestamp,
-                    total_mentions=0,
+        # Step 2: Search Twitter for mentions of all tokens in batched requests
+        tweets_by_address = {}
+
+        if twitter_enabled:
+            searchable = [
+                t for t in new_tokens
+                if t.address and t.symbol and t.symbol != "???"
+            ]
+            symbols = list(dict.fromkeys(t.symbol for t in searchable))
+            all_tweets = await twitter.search_cashtags(symbols, max_items=10 * len(symbols))
+            tweets_by_address = match_tweets_to_tokens(searchable, all_tweets)
+
+        # Step 3: Store tokens and mentions. All network I/O is finished here,
+        # so the write transaction is never held open across an await.
+        db = SessionLocal()
+        try:
+            viral_tokens = store_viral_tokens(db, new_tokens, tweets_by_address)
+            TickerAnalyzer(db).record_snapshots()
+        finally:
+            db.close()
+
+        # Log top tokens as a single record, and only build it if it will be emitted
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["=" * 50, "TOP VIRAL PUMP.FUN TOKENS:", "=" * 50]
+            for i, token in enumerate(viral_tokens[:10], 1):
+                mcap_str = f"${token.market_cap:,.0f}" if token.market_cap > 0 else "N/A"
+                lines.append(
+                    f"{i}. ${token.symbol} | Age: {token.age_minutes}m | "
+                    f"MCap: {mcap_str} | Tweets: {token.twitter_mentions} | "
+                    f"Score: {token.viral_score:.0f}"
                 )
-                db.add(db_ticker)
-                db.flush()
-                logger.info(f"New token: ${token.symbol} ({token.address[:8]}...{token.address[-4:]}) - {age_minutes}m old")
-
-            # Search Twitter for this token's CA (if we have API key)
-            twitter_mentions = 0
-            twitter_engagement = 0
-
-            if settings.rapidapi_key and token.address:
-                # Search for the CA on Twitter
-                tweets = await twitter.search_cashtags([token.symbol], max_items=10)
-
-                for tweet in tweets:
-                    # Check if tweet mentions this specific CA
-                    if token.address in tweet.text or token.symbol.upper() in tweet.text.upper():
-                        twitter_mentions += 1
-                        twitter_engagement += tweet.likes + tweet.retweets
-
-                        # Store mention
-                        existing = db.query(Mention).filter(Mention.tweet_id == tweet.tweet_id).first()
-                        if not existing:
-                            db_mention = Mention(
-                                ticker_id=db_ticker.id,
-                                tweet_id=tweet.tweet_id,
-                                tweet_text=tweet.text[:2000],
-                                tweet_url=tweet.url,
-                                author_username=tweet.author_username,
-                                author_followers=tweet.author_followers,
-                                likes=tweet.likes,
-                                retweets=tweet.retweets,
-                                timestamp=tweet.timestamp,
-                            )
-                            db.add(db_mention)
-                            db_ticker.total_mentions += 1
-
-            # Calculate viral score
-            # Factors: age (newer = better), mentions, engagement, market cap
-            age_factor = max(0, 1 - (age_minutes / 360))  # 0-1, newer is higher
-            mention_factor = min(twitter_mentions * 10, 100)  # Up to 100 points
-            engagement_factor = min(twitter_engagement / 10, 50)  # Up to 50 points
-            mcap_factor = min(token.market_cap / 10000, 50) if token.market_cap > 0 else 0  # Up to 50 points
-
-            viral_score = (age_factor * 50) + mention_factor + engagement_factor + mcap_factor
-
-            viral_tokens.append(ViralToken(
-                address=token.address,
-                name=token.name,
-                symbol=token.symbol,
-                created_timestamp=token.created_timestamp,
-                age_minutes=age_minutes,
-                market_cap=token.market_cap,
-                twitter_mentions=twitter_mentions,
-                twitter_engagement=twitter_engagement,
-                viral_score=viral_score,
-                pump_fun_data=token,
-            ))
-
-        db.commit()
-
-        # Sort by viral score
-        viral_tokens.sort(key=lambda x: x.viral_score, reverse=True)
-
-        # Log top tokens
-        logger.info("=" * 50)
-        logger.info("TOP VIRAL PUMP.FUN TOKENS:")
-        logger.info("=" * 50)
-
-        for i, token in enumerate(viral_tokens[:10], 1):
-            mcap_str = f"${token.market_cap:,.0f}" if token.market_cap > 0 else "N/A"
-            logger.info(
-                f"{i}. ${token.symbol} | Age: {token.age_minutes}m | "
-                f"MCap: {mcap_str} | Tweets: {token.twitter_mentions} | "
-                f"Score: {token.viral_score:.0f}"
-            )
-            logger.info(f"   CA: {token.address}")
+                lines.append(f"   CA: {token.address}")
+            lines.append("=" * 50)
+            logger.info("\n".join(lines))
 
-        logger.info("=" * 50)
         logger.info("Scrape cycle completed")
 
-    except Exception as e:
-        logger.error(f"Scrape cycle failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Scrape cycle failed")
     finally:
-        await pumpfun.close()
-        await dexscreener.close()
-        db.close()
+        # Let the dashboard pick up this cycle's data before its cache expires
+        invalidate_cache()
+
+
+def match_tweets_to_tokens(
+    tokens: list[PumpFunToken],
+    tweets: list[Tweet],
+) -> dict[str, list[Tweet]]:
+    """
+    Bucket tweets by the token addresses they mention.
+
+    A tweet matches a token if it contains the token's contract address, or
+    its symbol as a whole $cashtag (case-insensitive; "$SYM1" does not match
+    "$SYM10"). The tweets come from one search for all tokens, so a bare
+    symbol would pick up unrelated tweets ("ON" inside "BONK"). All patterns
+    are compiled into two Aho-Corasick automata so each tweet is scanned once
+    instead of once per token. A tweet returned by several searches is only
+    counted once.
+    """
+    import ahocorasick
+
+    tweets_by_address = defaultdict(list)
+    if not tokens:
+        return tweets_by_address
+
+    symbol_addresses = defaultdict(set)
+    for token in tokens:
+        symbol_addresses[token.symbol.upper()].add(token.address)
+
+    # Addresses are matched case-sensitively, cashtags against uppercased text
+    address_matcher = ahocorasick.Automaton()
+    for token in tokens:
+        address_matcher.add_word(token.address, (token.address,))
+    address_matcher.make_automaton()
+
+    symbol_matcher = ahocorasick.Automaton()
+    for symbol, addresses in symbol_addresses.items():
+        symbol_matcher.add_word("$" + symbol, tuple(addresses))
+    symbol_matcher.make_automaton()
+
+    unique_tweets = {tweet.tweet_id: tweet for tweet in tweets}
+
+    for tweet in unique_tweets.values():
+        matched = set()
+        for _, addresses in address_matcher.iter(tweet.text):
+            matched.update(addresses)
+        text = tweet.text.upper()
+        for end, addresses in symbol_matcher.iter(text):
+            # The cashtag must end at a word boundary
+            if end + 1 == len(text) or not text[end + 1].isalnum():
+                matched.update(addresses)
+
+        for address in matched:
+            tweets_by_address[address].append(tweet)
+
+    return tweets_by_address
+
+
+def store_viral_tokens(
+    db: Session,
+    new_tokens: list[PumpFunToken],
+    tweets_by_address: dict[str, list[Tweet]],
+) -> list[ViralToken]:
+    """Store new tokens and their tweet mentions, and score them
+
+    Returns:
+        Scored tokens, highest viral score first
+    """
+    import numpy as np
+
+    scored = []
+    mention_rows = []
+    new_mention_counts = defaultdict(int)
+    now = datetime.now(timezone.utc)
+
+    # Skip tokens with invalid/missing data
+    valid_tokens = [
+        t for t in new_tokens
+        if t.address and t.symbol and t.symbol != "???"
+    ]
+
+    # Prefetch existing tickers and stored tweets in bulk rather than
+    # querying once per token and once per tweet
+    tickers_by_address = {
+        ticker.contract_address: ticker
+        for ticker in db.query(Ticker).filter(
+            Ticker.contract_address.in_({t.address for t in valid_tokens})
+        )
+    }
+    known_symbols = {
+        row.symbol
+        for row in db.query(Ticker.symbol).filter(
+            Ticker.symbol.in_({t.symbol for t in valid_tokens})
+        )
+    }
+    tweet_ids = {tweet.tweet_id for tweets in tweets_by_address.values() for tweet in tweets}
+    stored_tweet_ids = {
+        row.tweet_id
+        for row in db.query(Mention.tweet_id).filter(Mention.tweet_id.in_(tweet_ids))
+    } if tweet_ids else set()
+
+    # Calculate ages in minutes for the whole batch
+    created = np.fromiter(
+        (t.created_timestamp.timestamp() for t in valid_tokens),
+        dtype=np.float64,
+        count=len(valid_tokens),
+    )
+    ages_minutes = ((now.timestamp() - created) / 60).astype(np.int64).tolist()
 
+    for token, age_minutes in zip(valid_tokens, ages_minutes):
+        # Store token in database - look up by contract_address (unique per token)
+        db_ticker = tickers_by_address.get(token.address)
+
+        if not db_ticker:
+            # Also check if symbol exists (to avoid unique constraint error)
+            if token.symbol in known_symbols:
+                # Symbol exists with different address - update address or skip
+                logger.debug(f"Symbol ${token.symbol} already exists, skipping duplicate")
+                continue
 
-async def run_twitter_only_cycle(twitter: TwitterScraper, db):
+            db_ticker = Ticker(
+                symbol=token.symbol,
+                contract_address=token.address,
+                chain="solana",
+                first_seen=token.created_timestamp,
+                total_mentions=0,
+            )
+            db.add(db_ticker)
+            db.flush()
+            tickers_by_address[token.address] = db_ticker
+            known_symbols.add(token.symbol)
+            logger.info(f"New token: ${token.symbol} ({token.address[:8]}...{token.address[-4:]}) - {age_minutes}m old")
+
+        # Tweets mentioning this token's CA or symbol
+        twitter_mentions = 0
+        twitter_engagement = 0
+
+        for tweet in tweets_by_address.get(token.address, ()):
+            twitter_mentions += 1
+            twitter_engagement += tweet.likes + tweet.retweets
+
+            # Queue mention for the batched insert
+            if tweet.tweet_id not in stored_tweet_ids:
+                stored_tweet_ids.add(tweet.tweet_id)
+                mention_rows.append({
+                    "ticker_id": db_ticker.id,
+                    "tweet_id": tweet.tweet_id,
+                    "tweet_text": tweet.text[:2000],
+                    "tweet_url": tweet.url,
+                    "author_username": tweet.author_username,
+                    "author_followers": tweet.author_followers,
+                    "likes": tweet.likes,
+                    "retweets": tweet.retweets,
+                    "timestamp": tweet.timestamp,
+                })
+                new_mention_counts[db_ticker.id] += 1
+
+        scored.append((token, age_minutes, twitter_mentions, twitter_engagement))
+
+    # One INSERT ... ON CONFLICT DO NOTHING and one UPDATE for the whole batch
+    insert_ignore(db, Mention, mention_rows, index_elements=["tweet_id"])
+    increment_mention_counts(db, new_mention_counts)
+    db.commit()
+
+    if not scored:
+        return []
+
+    # Calculate viral scores for the whole batch at once
+    # Factors: age (newer = better), mentions, engagement, market cap
+    ages = np.fromiter((s[1] for s in scored), dtype=np.float64, count=len(scored))
+    mentions = np.fromiter((s[2] for s in scored), dtype=np.float64, count=len(scored))
+    engagement = np.fromiter((s[3] for s in scored), dtype=np.float64, count=len(scored))
+    mcaps = np.fromiter((s[0].market_cap for s in scored), dtype=np.float64, count=len(scored))
+
+    age_factor = np.maximum(0, 1 - ages / 360)  # 0-1, newer is higher
+    mention_factor = np.minimum(mentions * 10, 100)  # Up to 100 points
+    engagement_factor = np.minimum(engagement / 10, 50)  # Up to 50 points
+    mcap_factor = np.where(mcaps > 0, np.minimum(mcaps / 10000, 50), 0)  # Up to 50 points
+
+    scores = (age_factor * 50) + mention_factor + engagement_factor + mcap_factor
+
+    # Highest score first; stable so ties keep pump.fun order
+    order = np.argsort(-scores, kind="stable")
+
+    viral_tokens = []
+    for i in order:
+        token, age_minutes, twitter_mentions, twitter_engagement = scored[i]
+        viral_tokens.append(ViralToken(
+            address=token.address,
+            name=token.name,
+            symbol=token.symbol,
+            created_timestamp=token.created_timestamp,
+            age_minutes=age_minutes,
+            market_cap=token.market_cap,
+            twitter_mentions=twitter_mentions,
+            twitter_engagement=twitter_engagement,
+            viral_score=float(scores[i]),
+            pump_fun_data=token,
+        ))
+
+    return viral_tokens
+
+
+async def run_twitter_only_cycle(twitter: TwitterScraper):
     """Fallback: Run Twitter-only scrape if pump.fun fails"""
-    logger.info("Running Twitter-only scrape...")
+    from src.analyzer.ticker import TickerAnalyzer, scan_tweets
 
-    analyzer = TickerAnalyzer(db)
+    logger.info("Running Twitter-only scrape...")
 
     tweets = await twitter.search_memecoin_terms(max_results=100)
 
@@ -241,19 +425,28 @@ async def run_twitter_only_cycle(twitter: TwitterScraper, db):
 
     logger.info(f"Found {len(tweets)} tweets")
 
-    # Extract pump.fun addresses
-    contracts = analyzer.extract_pump_fun_addresses(tweets)
-    logger.info(f"Extracted {len(contracts)} pump.fun contracts")
+    # Scan the tweet texts (in worker processes for large batches) before
+    # touching the database
+    scans = await scan_tweets(tweets)
+
+    # Only open the session once the network fetch is done
+    db = SessionLocal()
+    try:
+        analyzer = TickerAnalyzer(db)
 
-    # Process
-    analyzer.process_contracts(contracts)
+        # Extract tickers and pump.fun addresses in one pass over the tweets
+        mentions, contracts = analyzer.extract_all(tweets, scans)
+        logger.info(f"Extracted {len(contracts)} pump.fun contracts")
 
-    # Also extract tickers
-    mentions = analyzer.extract_tickers(tweets)
-    analyzer.process_mentions(mentions)
+        # Process
+        analyzer.process_contracts(contracts)
+        analyzer.process_mentions(mentions)
 
-    # Show trending
-    trending = analyzer.calculate_trending(limit=10)
+        # Snapshot this cycle's trends, then show them
+        analyzer.record_snapshots()
+        trending = analyzer.calculate_trending(limit=10)
+    finally:
+        db.close()
 
     if trending:
         logger.info("Top trending:")
@@ -261,8 +454,16 @@ async def run_twitter_only_cycle(twitter: TwitterScraper, db):
             logger.info(f"  {i}. ${t.symbol} - Score: {t.score:.0f}")
 
 
+def _next_aligned_minute() -> datetime:
+    """Get the first whole-minute tick one scrape interval from now"""
+    now = datetime.now().replace(second=0, microsecond=0)
+    return now + timedelta(minutes=settings.scrape_interval_minutes)
+
+
 async def run_scraper_loop():
     """Run the scraper on a schedule"""
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
     scheduler = AsyncIOScheduler()
 
     # Run immediately on start
@@ -274,37 +475,53 @@ async def run_scraper_loop():
         "interval",
         minutes=settings.scrape_interval_minutes,
         id="scraper",
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=60,
+        next_run_time=_next_aligned_minute(),
     )
 
     scheduler.start()
     logger.info(f"Scraper scheduled to run every {settings.scrape_interval_minutes} minutes")
 
-    # Keep running
+    # Keep running until shutdown is requested
     try:
-        while True:
-            await asyncio.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
+        await _stop.wait()
+    finally:
         scheduler.shutdown()
 
 
-async def run_telegram_bot():
-    """Run the Telegram bot"""
+async def run_telegram_bot(webhook: bool = False):
+    """
+    Run the Telegram bot.
+
+    Args:
+        webhook: Receive updates through the dashboard's webhook route rather
+            than polling; only valid when the dashboard runs in this process
+    """
+    from src.bots.telegram_bot import TelegramBot
+
     if not settings.telegram_bot_token:
         logger.warning("Telegram bot token not configured. Skipping bot startup.")
         return
 
     bot = TelegramBot()
-    await bot.start()
+    if webhook:
+        from src.dashboard.app import app as dashboard_app
+
+        dashboard_app.state.telegram_bot = bot
+    await bot.start(webhook_url=settings.telegram_webhook_url if webhook else None)
 
     try:
-        while True:
-            await asyncio.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
+        await _stop.wait()
+    finally:
         await bot.stop()
 
 
 def run_dashboard():
     """Run the web dashboard"""
+    import uvicorn
+
     logger.info(f"Starting dashboard at http://{settings.dashboard_host}:{settings.dashboard_port}")
     uvicorn.run(
         "src.dashboard.app:app",
@@ -314,9 +531,47 @@ def run_dashboard():
     )
 
 
+async def run_dashboard_server():
+    """Run the web dashboard on the current event loop until shutdown"""
+    import uvicorn
+
+    logger.info(f"Starting dashboard at http://{settings.dashboard_host}:{settings.dashboard_port}")
+    server = uvicorn.Server(uvicorn.Config(
+        "src.dashboard.app:app",
+        host=settings.dashboard_host,
+        port=settings.dashboard_port,
+        loop="asyncio",
+        log_config=None,
+    ))
+
+    async def stop_on_shutdown():
+        await _stop.wait()
+        server.should_exit = True
+
+    watcher = asyncio.create_task(stop_on_shutdown())
+    try:
+        await server.serve()
+    finally:
+        # Uvicorn may have handled the signal itself; stop the other tasks too
+        watcher.cancel()
+        _stop.set()
+
+
+def install_signal_handlers():
+    """Request shutdown on SIGINT/SIGTERM"""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _stop.set)
+        except NotImplementedError:
+            # Not supported on Windows; Ctrl+C cancels asyncio.run() instead
+            pass
+
+
 async def run_all():
     """Run scraper, dashboard, and bot together"""
     logger.info("Starting Trench Scan...")
+    install_signal_handlers()
 
     # Initialize database
     init_db()
@@ -326,20 +581,38 @@ async def run_all():
         asyncio.create_task(run_scraper_loop()),
     ]
 
-    # Add Telegram bot if configured
+    # Add Telegram bot if configured. With a webhook URL it is fed by the
+    # dashboard served below instead of polling.
     if settings.telegram_bot_token:
-        tasks.append(asyncio.create_task(run_telegram_bot()))
+        webhook = bool(settings.telegram_webhook_url)
+        tasks.append(asyncio.create_task(run_telegram_bot(webhook=webhook)))
 
-    # Run dashboard in a separate thread (it's blocking)
-    import threading
-
-    dashboard_thread = threading.Thread(target=run_dashboard, daemon=True)
-    dashboard_thread.start()
+    # Serve the dashboard from this event loop rather than a second loop in
+    # a thread, so dashboard reads and scraper writes share one scheduler
+    tasks.append(asyncio.create_task(run_dashboard_server()))
 
     try:
         await asyncio.gather(*tasks)
     except (KeyboardInterrupt, SystemExit):
         logger.info("Shutting down...")
+    finally:
+        await shutdown()
+
+
+async def run_single_scrape():
+    """Run one scrape cycle, then release the scrapers' connections"""
+    try:
+        await run_scrape_cycle()
+    finally:
+        await shutdown()
+
+
+async def shutdown():
+    """Release the scrapers' connections and the analyzer's worker pool"""
+    from src.analyzer.ticker import shutdown_scan_executor
+
+    await close_scrapers()
+    shutdown_scan_executor()
 
 
 def main():
@@ -348,8 +621,17 @@ def main():
         print(__doc__)
         sys.exit(1)
 
+    setup_logging()
+
     command = sys.argv[1].lower()
 
+    # Use uvloop's faster event loop where it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     if command == "init":
         print("Initializing database...")
         init_db()
@@ -358,7 +640,7 @@ def main():
     elif command == "scrape":
         print("Running single scrape cycle...")
         init_db()
-        asyncio.run(run_scrape_cycle())
+        asyncio.run(run_single_scrape())
 
     elif command == "dashboard":
         print("Starting web dashboard...")
@@ -1,14 +1,27 @@
+import asyncio
+import multiprocessing
+import os
 import re
 import logging
 from datetime import datetime, timedelta
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-
-from src.database.models import Ticker, Mention, TrendSnapshot
+import ahocorasick
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Row, bindparam, case, func, select, true
+
+from src.config import settings
+from src.database.models import (
+    Ticker,
+    Mention,
+    TrendSnapshot,
+    increment_mention_counts,
+    insert_ignore,
+)
 from src.scraper.twitter import Tweet
 
 logger = logging.getLogger(__name__)
@@ -36,6 +49,16 @@ FALSE_POSITIVES = {
     "HODL", "WAGMI", "NGMI", "GM", "GN", "LFG", "NFA", "DYOR",
 }
 
+# Symbols never reported as tickers
+_SKIP_SYMBOLS: frozenset[str] = frozenset(KNOWN_COINS | FALSE_POSITIVES)
+
+# Memecoin-related keywords that boost ticker confidence
+MEMECOIN_KEYWORDS: tuple[str, ...] = (
+    "memecoin", "meme coin", "gem", "100x", "1000x", "moon",
+    "degen", "ape", "launch", "presale", "stealth", "fair launch",
+    "ca:", "contract:", "dexscreener", "birdeye", "pump.fun",
+)
+
 
 @dataclass
 class TickerMention:
@@ -69,21 +92,169 @@ class ContractMention:
     is_pump_fun: bool
 
 
-class TickerAnalyzer:
-    """Analyzes tweets to extract and score ticker/contract mentions"""
+# Single pattern for everything extracted from a tweet, so each tweet is
+# scanned once. Alternatives, tried in order at each position:
+# - ticker: $TICKER symbols (3+ letters; shorter ones are likely noise)
+# - pump: pump.fun addresses (44 chars total, ending in "pump"); these
+#   are also valid Solana addresses
+# - solana: other base58 Solana addresses
+# - ethereum: 0x-prefixed EVM addresses
+# Tickers start with "$" and addresses are whole words of 32+ chars, so
+# no alternative can shadow a match another would have found on its own.
+TWEET_PATTERN = re.compile(
+    r'\$(?P<ticker>[A-Za-z]{3,10})\b'
+    r'|\b(?:'
+    r'(?P<pump>[1-9A-HJ-NP-Za-km-z]{40}pump)'
+    r'|(?P<solana>[1-9A-HJ-NP-Za-km-z]{32,44})'
+    r'|(?P<ethereum>0x[a-fA-F0-9]{40})'
+    r')\b'
+)
+
+
+@dataclass
+class _TweetScan:
+    """Tickers and contract addresses found in one tweet's text"""
+
+    tickers: list[str] = field(default_factory=list)
+    pump_addresses: list[str] = field(default_factory=list)
+    solana_addresses: list[str] = field(default_factory=list)
+    has_contract: bool = False  # Any contract address, including Ethereum
+    pump_fun_context: bool = False  # Mentions pump.fun by name
+    kw_hits: int = 0  # Distinct MEMECOIN_KEYWORDS (only counted if there are tickers)
+
+
+def _keyword_automaton(keywords) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton that reports each matched keyword"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_MATCHER = _keyword_automaton(MEMECOIN_KEYWORDS)
+
+# Worker pool for scanning large tweet batches, created on first use and
+# kept for the life of the process
+_scan_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _scan_text(text: str) -> _TweetScan:
+    """Find tickers, contract addresses and keyword context in one tweet's text"""
+    scan = _TweetScan()
 
-    # Regex pattern for ticker symbols ($TICKER)
-    TICKER_PATTERN = re.compile(r'\$([A-Z]{2,10})\b', re.IGNORECASE)
+    for match in TWEET_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == "ticker":
+            scan.tickers.append(match.group(kind))
+            continue
 
-    # Pattern for contract addresses
-    CONTRACT_PATTERNS = {
-        "solana": re.compile(r'\b([1-9A-HJ-NP-Za-km-z]{32,44})\b'),
-        "ethereum": re.compile(r'\b(0x[a-fA-F0-9]{40})\b'),
+        scan.has_contract = True
+        if kind == "pump":
+            # Pump.fun addresses (ending in "pump") are Solana addresses too
+            scan.pump_addresses.append(match.group())
+            scan.solana_addresses.append(match.group())
+        elif kind == "solana":
+            scan.solana_addresses.append(match.group())
+
+    text_lower = text.lower()
+    scan.pump_fun_context = "pump.fun" in text_lower or "pumpfun" in text_lower
+    if scan.tickers:
+        scan.kw_hits = len({kw for _, kw in _KEYWORD_MATCHER.iter(text_lower)})
+
+    return scan
+
+
+def _scan_texts(texts: list[str]) -> list[_TweetScan]:
+    """Scan a chunk of tweet texts (run in worker processes for large batches)"""
+    return [_scan_text(text) for text in texts]
+
+
+def _get_scan_executor() -> ProcessPoolExecutor:
+    """Get the shared scan worker pool, creating it on first use"""
+    global _scan_executor
+    if _scan_executor is None:
+        # Spawned rather than forked: the parent runs threads (log listener,
+        # threadpools) that a fork would copy mid-state
+        _scan_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _scan_executor
+
+
+def shutdown_scan_executor():
+    """Stop the scan worker pool, if one was started"""
+    global _scan_executor
+    if _scan_executor is not None:
+        _scan_executor.shutdown(cancel_futures=True)
+        _scan_executor = None
+
+
+async def scan_tweets(tweets: list[Tweet]) -> list[_TweetScan]:
+    """
+    Scan tweet texts without blocking the event loop.
+
+    With EXTRACT_PARALLEL on, batches larger than EXTRACT_BATCH_SIZE are
+    split into chunks that are scanned in the shared worker pool and
+    concatenated in order. Smaller batches are scanned inline, which is
+    cheaper than shipping them to a worker.
+    """
+    texts = [tweet.text for tweet in tweets]
+    batch_size = max(settings.extract_batch_size, 1)
+
+    if not settings.extract_parallel or len(texts) <= batch_size:
+        return _scan_texts(texts)
+
+    loop = asyncio.get_running_loop()
+    executor = _get_scan_executor()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(executor, _scan_texts, texts[i:i + batch_size])
+        for i in range(0, len(texts), batch_size)
+    ))
+    return list(chain.from_iterable(results))
+
+
+def _mention_row(ticker_id: int, tweet: Tweet) -> dict:
+    """Build the Mention column values for a tweet"""
+    return {
+        "ticker_id": ticker_id,
+        "tweet_id": tweet.tweet_id,
+        "tweet_text": tweet.text[:2000],  # Truncate if needed
+        "tweet_url": tweet.url,
+        "author_username": tweet.author_username,
+        "author_followers": tweet.author_followers,
+        "likes": tweet.likes,
+        "retweets": tweet.retweets,
+        "timestamp": tweet.timestamp,
     }
 
-    # Pattern specifically for pump.fun addresses (end with "pump")
-    # Pump.fun addresses are 44 chars total, ending in "pump"
-    PUMP_FUN_PATTERN = re.compile(r'\b([1-9A-HJ-NP-Za-km-z]{40}pump)\b')
+
+def _stats_statement():
+    """Build the overall-stats query once, with the window cutoffs as bind parameters"""
+    hour_ago = bindparam("hour_ago")
+    day_ago = bindparam("day_ago")
+
+    # Each table is scanned once, with conditional counts for the windows
+    tickers = select(
+        func.count(Ticker.id).label("total_tickers"),
+        func.count(case((Ticker.first_seen >= day_ago, 1))).label("new_tickers_24h"),
+    ).subquery()
+    mentions = select(
+        func.count(Mention.id).label("total_mentions"),
+        func.count(case((Mention.timestamp >= hour_ago, 1))).label("mentions_1h"),
+        func.count(case((Mention.timestamp >= day_ago, 1))).label("mentions_24h"),
+    ).subquery()
+
+    # Both sides are single rows, so an unconditional join pairs them up
+    return select(tickers, mentions).join_from(tickers, mentions, true())
+
+
+_STATS_STMT = _stats_statement()
+
+
+class TickerAnalyzer:
+    """Analyzes tweets to extract and score ticker/contract mentions"""
 
     def __init__(self, db: Session):
         self.db = db
@@ -99,35 +270,10 @@ class TickerAnalyzer:
             List of ContractMention objects for pump.fun addresses
         """
         mentions = []
+        seen_addresses = set()
 
-        for tweet in tweets:
-            # Find pump.fun addresses (ending in "pump")
-            pump_matches = self.PUMP_FUN_PATTERN.findall(tweet.text)
-
-            for address in pump_matches:
-                mentions.append(
-                    ContractMention(
-                        address=address,
-                        chain="solana",
-                        tweet=tweet,
-                        is_pump_fun=True,
-                    )
-                )
-
-            # Also check for general Solana addresses mentioned with pump.fun context
-            if "pump.fun" in tweet.text.lower() or "pumpfun" in tweet.text.lower():
-                sol_matches = self.CONTRACT_PATTERNS["solana"].findall(tweet.text)
-                for address in sol_matches:
-                    # Skip if already found as pump.fun address
-                    if address not in [m.address for m in mentions]:
-                        mentions.append(
-                            ContractMention(
-                                address=address,
-                                chain="solana",
-                                tweet=tweet,
-                                is_pump_fun=True,
-                            )
-                        )
+        for tweet, scan in zip(tweets, self._scan_tweets(tweets)):
+            self._extract_tweet_contracts(tweet, scan, mentions, seen_addresses)
 
         logger.info(f"Extracted {len(mentions)} pump.fun addresses from {len(tweets)} tweets")
         return mentions
@@ -144,33 +290,117 @@ class TickerAnalyzer:
         """
         mentions = []
 
-        for tweet in tweets:
-            # Find all $TICKER mentions in tweet text
-            matches = self.TICKER_PATTERN.findall(tweet.text)
+        for tweet, scan in zip(tweets, self._scan_tweets(tweets)):
+            self._extract_tweet_tickers(tweet, scan, mentions)
+
+        logger.info(f"Extracted {len(mentions)} ticker mentions from {len(tweets)} tweets")
+        return mentions
+
+    def extract_all(
+        self,
+        tweets: list[Tweet],
+        scans: Optional[list[_TweetScan]] = None,
+    ) -> tuple[list[TickerMention], list[ContractMention]]:
+        """
+        Extract ticker symbols and pump.fun addresses in a single pass.
 
-            for match in matches:
-                symbol = match.upper()
+        Equivalent to calling extract_tickers and extract_pump_fun_addresses,
+        but scans each tweet's text only once.
 
-                # Skip known coins and false positives
-                if symbol in KNOWN_COINS or symbol in FALSE_POSITIVES:
-                    continue
+        Args:
+            tweets: List of Tweet objects to analyze
+            scans: The tweets' scans from scan_tweets, if already done
 
-                # Skip very short tickers (likely noise)
-                if len(symbol) < 3:
-                    continue
+        Returns:
+            Tuple of (TickerMention list, ContractMention list)
+        """
+        ticker_mentions = []
+        contract_mentions = []
+        seen_addresses = set()
+
+        if scans is None:
+            scans = self._scan_tweets(tweets)
+
+        for tweet, scan in zip(tweets, scans):
+            self._extract_tweet_tickers(tweet, scan, ticker_mentions)
+            self._extract_tweet_contracts(tweet, scan, contract_mentions, seen_addresses)
+
+        logger.info(f"Extracted {len(ticker_mentions)} ticker mentions from {len(tweets)} tweets")
+        logger.info(f"Extracted {len(contract_mentions)} pump.fun addresses from {len(tweets)} tweets")
+        return ticker_mentions, contract_mentions
+
+    def _scan_tweets(self, tweets: list[Tweet]) -> list[_TweetScan]:
+        """Scan tweet texts in this process (see scan_tweets for the parallel path)"""
+        return _scan_texts([tweet.text for tweet in tweets])
+
+    def _extract_tweet_contracts(
+        self,
+        tweet: Tweet,
+        scan: _TweetScan,
+        mentions: list[ContractMention],
+        seen_addresses: set[str],
+    ):
+        """
+        Append pump.fun contract mentions found in one tweet to mentions.
 
-                # Calculate confidence based on context
-                confidence = self._calculate_confidence(symbol, tweet)
+        seen_addresses holds every address already in mentions and is kept
+        up to date here, so the batch-wide duplicate check is a set lookup.
+        """
+        for address in scan.pump_addresses:
+            seen_addresses.add(address)
+            mentions.append(
+                ContractMention(
+                    address=address,
+                    chain="solana",
+                    tweet=tweet,
+                    is_pump_fun=True,
+                )
+            )
 
-                if confidence > 0.3:  # Minimum threshold
+        # Also check for general Solana addresses mentioned with pump.fun context
+        if scan.pump_fun_context:
+            for address in scan.solana_addresses:
+                # Skip if already found as pump.fun address
+                if address not in seen_addresses:
+                    seen_addresses.add(address)
                     mentions.append(
-                        TickerMention(symbol=symbol, tweet=tweet, confidence=confidence)
+                        ContractMention(
+                            address=address,
+                            chain="solana",
+                            tweet=tweet,
+                            is_pump_fun=True,
+                        )
                     )
 
-        logger.info(f"Extracted {len(mentions)} ticker mentions from {len(tweets)} tweets")
-        return mentions
+    def _extract_tweet_tickers(
+        self,
+        tweet: Tweet,
+        scan: _TweetScan,
+        mentions: list[TickerMention],
+    ):
+        """Append ticker mentions found in one tweet to mentions"""
+        for match in scan.tickers:
+            symbol = match.upper()
+
+            # Skip known coins and false positives
+            if symbol in _SKIP_SYMBOLS:
+                continue
+
+            # Calculate confidence based on context
+            confidence = self._calculate_confidence(symbol, tweet, scan.kw_hits, scan.has_contract)
 
-    def _calculate_confidence(self, symbol: str, tweet: Tweet) -> float:
+            if confidence > 0.3:  # Minimum threshold
+                mentions.append(
+                    TickerMention(symbol=symbol, tweet=tweet, confidence=confidence)
+                )
+
+    def _calculate_confidence(
+        self,
+        symbol: str,
+        tweet: Tweet,
+        kw_hits: int,
+        has_contract: bool,
+    ) -> float:
         """
         Calculate confidence score that this is a real memecoin ticker.
 
@@ -179,36 +409,38 @@ class TickerAnalyzer:
         - Presence of contract address
         - Memecoin-related keywords
         - Author follower count
-        """
-        score = 0.5  # Base score
 
-        text_lower = tweet.text.lower()
-
-        # Boost for memecoin-related keywords
-        memecoin_keywords = [
-            "memecoin", "meme coin", "gem", "100x", "1000x", "moon",
-            "degen", "ape", "launch", "presale", "stealth", "fair launch",
-            "ca:", "contract:", "dexscreener", "birdeye", "pump.fun",
-        ]
-        keyword_matches = sum(1 for kw in memecoin_keywords if kw in text_lower)
-        score += min(keyword_matches * 0.1, 0.3)
+        Args:
+            symbol: Ticker symbol being scored
+            tweet: Tweet the symbol was found in
+            kw_hits: Number of distinct MEMECOIN_KEYWORDS in the tweet
+            has_contract: Whether the tweet contains a contract address
+        """
+        # Boosts are counted in tenths so the sum is exact. Cheap scalar
+        # checks come first; once they reach the cap, keywords can't matter.
+        boost = 0
 
         # Boost for engagement
         if tweet.likes > 100:
-            score += 0.1
+            boost += 1
         if tweet.likes > 1000:
-            score += 0.1
+            boost += 1
         if tweet.retweets > 50:
-            score += 0.1
+            boost += 1
 
         # Boost for contract address presence
-        for chain, pattern in self.CONTRACT_PATTERNS.items():
-            if pattern.search(tweet.text):
-                score += 0.2
-                break
+        if has_contract:
+            boost += 2
 
-        # Cap at 1.0
-        return min(score, 1.0)
+        # Already at the 1.0 cap
+        if boost >= 5:
+            return 1.0
+
+        # Boost for memecoin-related keywords
+        boost += min(kw_hits, 3)
+
+        # Base score 0.5, capped at 1.0
+        return min(0.5 + boost / 10, 1.0)
 
     def process_mentions(self, mentions: list[TickerMention]) -> dict[str, int]:
         """
@@ -221,19 +453,26 @@ class TickerAnalyzer:
             Dict of {symbol: mention_count}
         """
         mention_counts = defaultdict(int)
+        mention_rows = []
+        new_mention_counts = defaultdict(int)  # ticker id -> new mentions
         seen_tweet_ids = set()  # Track tweets processed in this batch
 
+        # Load the batch's tickers and already-stored tweets in two queries
+        tickers_by_symbol = {
+            ticker.symbol: ticker
+            for ticker in self.db.query(Ticker).filter(
+                Ticker.symbol.in_({m.symbol for m in mentions})
+            )
+        }
+        stored_tweet_ids = self._stored_tweet_ids(m.tweet.tweet_id for m in mentions)
+
         for mention in mentions:
             # Skip if we already processed this tweet in this batch
             if mention.tweet.tweet_id in seen_tweet_ids:
                 continue
 
             # Get or create ticker
-            ticker = (
-                self.db.query(Ticker)
-                .filter(Ticker.symbol == mention.symbol)
-                .first()
-            )
+            ticker = tickers_by_symbol.get(mention.symbol)
 
             if not ticker:
                 ticker = Ticker(
@@ -243,39 +482,25 @@ class TickerAnalyzer:
                 )
                 self.db.add(ticker)
                 self.db.flush()
+                tickers_by_symbol[mention.symbol] = ticker
                 logger.info(f"New ticker discovered: ${mention.symbol}")
 
             # Check if we already have this tweet in database
-            existing = (
-                self.db.query(Mention)
-                .filter(Mention.tweet_id == mention.tweet.tweet_id)
-                .first()
-            )
-
-            if not existing:
-                # Add mention
-                db_mention = Mention(
-                    ticker_id=ticker.id,
-                    tweet_id=mention.tweet.tweet_id,
-                    tweet_text=mention.tweet.text[:2000],  # Truncate if needed
-                    tweet_url=mention.tweet.url,
-                    author_username=mention.tweet.author_username,
-                    author_followers=mention.tweet.author_followers,
-                    likes=mention.tweet.likes,
-                    retweets=mention.tweet.retweets,
-                    timestamp=mention.tweet.timestamp,
-                )
-                self.db.add(db_mention)
+            if mention.tweet.tweet_id not in stored_tweet_ids:
+                # Queue mention for the bulk insert
+                mention_rows.append(_mention_row(ticker.id, mention.tweet))
 
                 # Mark tweet as seen in this batch
                 seen_tweet_ids.add(mention.tweet.tweet_id)
 
                 # Update ticker stats
-                ticker.total_mentions += 1
-                ticker.last_seen = datetime.utcnow()
+                new_mention_counts[ticker.id] += 1
 
                 mention_counts[mention.symbol] += 1
 
+        # Tweets stored concurrently since the prefetch are skipped by the database
+        insert_ignore(self.db, Mention, mention_rows, index_elements=["tweet_id"])
+        increment_mention_counts(self.db, new_mention_counts)
         self.db.commit()
         return dict(mention_counts)
 
@@ -290,8 +515,19 @@ class TickerAnalyzer:
             Dict of {address: mention_count}
         """
         mention_counts = defaultdict(int)
+        mention_rows = []
+        new_mention_counts = defaultdict(int)  # ticker id -> new mentions
         seen_tweet_ids = set()
 
+        # Load the batch's tickers and already-stored tweets in two queries
+        tickers_by_address = {
+            ticker.contract_address: ticker
+            for ticker in self.db.query(Ticker).filter(
+                Ticker.contract_address.in_({c.address for c in contracts})
+            )
+        }
+        stored_tweet_ids = self._stored_tweet_ids(c.tweet.tweet_id for c in contracts)
+
         for contract in contracts:
             if contract.tweet.tweet_id in seen_tweet_ids:
                 continue
@@ -300,11 +536,7 @@ class TickerAnalyzer:
             short_addr = f"{contract.address[:4]}...{contract.address[-4:]}"
 
             # Get or create ticker entry for this contract
-            ticker = (
-                self.db.query(Ticker)
-                .filter(Ticker.contract_address == contract.address)
-                .first()
-            )
+            ticker = tickers_by_address.get(contract.address)
 
             if not ticker:
                 ticker = Ticker(
@@ -316,80 +548,61 @@ class TickerAnalyzer:
                 )
                 self.db.add(ticker)
                 self.db.flush()
+                tickers_by_address[contract.address] = ticker
                 logger.info(f"New pump.fun token: {contract.address}")
 
             # Check if tweet already exists
-            existing = (
-                self.db.query(Mention)
-                .filter(Mention.tweet_id == contract.tweet.tweet_id)
-                .first()
-            )
-
-            if not existing:
-                db_mention = Mention(
-                    ticker_id=ticker.id,
-                    tweet_id=contract.tweet.tweet_id,
-                    tweet_text=contract.tweet.text[:2000],
-                    tweet_url=contract.tweet.url,
-                    author_username=contract.tweet.author_username,
-                    author_followers=contract.tweet.author_followers,
-                    likes=contract.tweet.likes,
-                    retweets=contract.tweet.retweets,
-                    timestamp=contract.tweet.timestamp,
-                )
-                self.db.add(db_mention)
+            if contract.tweet.tweet_id not in stored_tweet_ids:
+                mention_rows.append(_mention_row(ticker.id, contract.tweet))
                 seen_tweet_ids.add(contract.tweet.tweet_id)
 
-                ticker.total_mentions += 1
-                ticker.last_seen = datetime.utcnow()
+                new_mention_counts[ticker.id] += 1
 
                 mention_counts[contract.address] += 1
 
+        # Tweets stored concurrently since the prefetch are skipped by the database
+        insert_ignore(self.db, Mention, mention_rows, index_elements=["tweet_id"])
+        increment_mention_counts(self.db, new_mention_counts)
         self.db.commit()
         return dict(mention_counts)
 
-    def calculate_trending(self, limit: int = 20) -> list[TrendingTicker]:
-        """
-        Calculate trending tickers based on recent mention velocity.
+    def _stored_tweet_ids(self, tweet_ids) -> set[str]:
+        """Get which of the given tweet IDs already have a stored mention"""
+        tweet_ids = set(tweet_ids)
+        if not tweet_ids:
+            return set()
 
-        Args:
-            limit: Number of top trending tickers to return
+        return {
+            row.tweet_id
+            for row in self.db.query(Mention.tweet_id).filter(Mention.tweet_id.in_(tweet_ids))
+        }
 
-        Returns:
-            List of TrendingTicker objects sorted by score
+    def record_snapshots(self):
+        """
+        Snapshot the mention counts, velocity and score of every active ticker.
+
+        Runs once per scrape cycle, so calculate_trending can read the latest
+        snapshot instead of re-aggregating the mentions table per request.
         """
         now = datetime.utcnow()
         hour_ago = now - timedelta(hours=1)
         day_ago = now - timedelta(hours=24)
 
-        trending = []
-
-        # Get all tickers with recent activity
-        tickers = (
-            self.db.query(Ticker)
-            .filter(Ticker.last_seen >= day_ago)
-            .all()
-        )
-
-        for ticker in tickers:
-            # Count mentions in different time windows
-            mentions_1h = (
-                self.db.query(func.count(Mention.id))
-                .filter(
-                    Mention.ticker_id == ticker.id,
-                    Mention.timestamp >= hour_ago,
-                )
-                .scalar()
+        # Count mentions in both time windows for every ticker in one query
+        counts = {
+            row.ticker_id: (row.mentions_1h, row.mentions_24h)
+            for row in self.db.query(
+                Mention.ticker_id,
+                func.count(case((Mention.timestamp >= hour_ago, 1))).label("mentions_1h"),
+                func.count(Mention.id).label("mentions_24h"),
             )
+            .filter(Mention.timestamp >= day_ago)
+            .group_by(Mention.ticker_id)
+        }
 
-            mentions_24h = (
-                self.db.query(func.count(Mention.id))
-                .filter(
-                    Mention.ticker_id == ticker.id,
-                    Mention.timestamp >= day_ago,
-                )
-                .scalar()
-            )
+        snapshot_rows = []
+        for (ticker_id,) in self.db.query(Ticker.id).filter(Ticker.last_seen >= day_ago):
+            mentions_1h, mentions_24h = counts.get(ticker_id, (0, 0))
 
             # Calculate velocity (mentions per hour over last 24h vs last hour)
             avg_hourly = mentions_24h / 24 if mentions_24h > 0 else 0
@@ -399,13 +612,69 @@ class TickerAnalyzer:
             # Weighted: recent mentions matter more + velocity bonus
             score = (mentions_1h * 10) + (mentions_24h * 1) + (velocity * 5)
 
-            # Get latest tweet for this ticker
-            latest_mention = (
-                self.db.query(Mention)
-                .filter(Mention.ticker_id == ticker.id)
-                .order_by(Mention.timestamp.desc())
-                .first()
+            snapshot_rows.append({
+                "ticker_id": ticker_id,
+                "timestamp": now,
+                "mentions_1h": mentions_1h,
+                "mentions_24h": mentions_24h,
+                "velocity": velocity,
+                "score": score,
+            })
+
+        # Every row shares `now`, which marks them as one snapshot batch
+        self.db.bulk_insert_mappings(TrendSnapshot, snapshot_rows)
+        self.db.commit()
+
+    def calculate_trending(self, limit: int = 20) -> list[TrendingTicker]:
+        """
+        Get trending tickers from the latest snapshot batch.
+
+        Read-only: snapshots are written by the scrape cycle. A batch older
+        than two scrape intervals is not current (the scraper is down or its
+        last cycle had no active tickers), so nothing is returned for it.
+
+        Args:
+            limit: Number of top trending tickers to return
+
+        Returns:
+            List of TrendingTicker objects sorted by score
+        """
+        stale_before = datetime.utcnow() - timedelta(minutes=2 * settings.scrape_interval_minutes)
+
+        latest = self.db.query(func.max(TrendSnapshot.timestamp)).scalar()
+        if latest is None or latest < stale_before:
+            return []
+
+        rows = (
+            self.db.query(TrendSnapshot, Ticker.symbol, Ticker.first_seen)
+            .join(Ticker, Ticker.id == TrendSnapshot.ticker_id)
+            .filter(TrendSnapshot.timestamp == latest)
+            .order_by(TrendSnapshot.score.desc())
+            .limit(limit)
+            .all()
+        )
+
+        # Latest mention of each returned ticker in one windowed query
+        ranked = (
+            select(
+                Mention,
+                func.row_number().over(
+                    partition_by=Mention.ticker_id,
+                    order_by=(Mention.timestamp.desc(), Mention.id.desc()),
+                ).label("rank"),
             )
+            .where(Mention.ticker_id.in_([snapshot.ticker_id for snapshot, _, _ in rows]))
+            .subquery()
+        )
+        latest_mention_row = aliased(Mention, ranked)
+        latest_by_ticker = {
+            mention.ticker_id: mention
+            for mention in self.db.query(latest_mention_row).filter(ranked.c.rank == 1)
+        }
+
+        trending = []
+        for snapshot, symbol, first_seen in rows:
+            latest_mention = latest_by_ticker.get(snapshot.ticker_id)
 
             latest_tweet = None
             if latest_mention:
@@ -420,40 +689,54 @@ class TickerAnalyzer:
                     timestamp=latest_mention.timestamp,
                 )
 
-            # Save snapshot
-            snapshot = TrendSnapshot(
-                ticker_id=ticker.id,
-                mentions_1h=mentions_1h,
-                mentions_24h=mentions_24h,
-                velocity=velocity,
-                score=score,
-            )
-            self.db.add(snapshot)
-
             trending.append(
                 TrendingTicker(
-                    symbol=ticker.symbol,
-                    mentions_1h=mentions_1h,
-                    mentions_24h=mentions_24h,
-                    velocity=velocity,
-                    score=score,
-                    first_seen=ticker.first_seen,
+                    symbol=symbol,
+                    mentions_1h=snapshot.mentions_1h,
+                    mentions_24h=snapshot.mentions_24h,
+                    velocity=snapshot.velocity,
+                    score=snapshot.score,
+                    first_seen=first_seen,
                     latest_tweet=latest_tweet,
                 )
             )
 
-        self.db.commit()
+        return trending
 
-        # Sort by score and return top results
-        trending.sort(key=lambda x: x.score, reverse=True)
-        return trending[:limit]
+    def get_new_tickers(self, hours: int = 1, limit: Optional[int] = None) -> list[Row]:
+        """
+        Get tickers first seen in the last N hours.
+
+        Args:
+            hours: How far back to look
+            limit: Maximum number of tickers to return (all if None)
 
-    def get_new_tickers(self, hours: int = 1) -> list[Ticker]:
-        """Get tickers first seen in the last N hours"""
+        Returns:
+            Rows of (symbol, first_seen, contract_address, total_mentions),
+            newest first
+        """
         since = datetime.utcnow() - timedelta(hours=hours)
         return (
-            self.db.query(Ticker)
+            self.db.query(
+                Ticker.symbol,
+                Ticker.first_seen,
+                Ticker.contract_address,
+                Ticker.total_mentions,
+            )
             .filter(Ticker.first_seen >= since)
             .order_by(Ticker.first_seen.desc())
+            .limit(limit)
             .all()
         )
+
+    def get_stats(self) -> dict:
+        """
+        Get overall ticker and mention counts in a single query.
+
+        Returns:
+            Dict of total_tickers, new_tickers_24h, total_mentions,
+            mentions_1h and mentions_24h
+        """
+        now = datetime.utcnow()
+        params = {"hour_ago": now - timedelta(hours=1), "day_ago": now - timedelta(hours=24)}
+        return self.db.execute(_STATS_STMT, params).one()._asdict()
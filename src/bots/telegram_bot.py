@@ -1,9 +1,14 @@
+import asyncio
 import logging
+import secrets
+import time
 from datetime import datetime
-from typing import Optional
+from functools import wraps
+from typing import Callable, Optional, TypeVar
 
 from telegram import Update, Bot
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.constants import ParseMode
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes, ExtBot
 
 from src.config import settings
 from src.database.models import SessionLocal, Ticker
@@ -11,6 +16,96 @@ from src.analyzer.ticker import TickerAnalyzer, TrendingTicker
 
 logger = logging.getLogger(__name__)
 
+# Seconds Telegram holds a getUpdates request open waiting for new updates
+POLL_TIMEOUT = 30
+
+# Times a rate-limited (429) request is retried after waiting out RetryAfter
+SEND_RETRIES = 3
+
+# Handlers slower than this are logged as warnings
+SLOW_COMMAND_SECONDS = 1.0
+
+# Characters MarkdownV2 treats as markup; literal uses need a backslash
+_MDV2_ESCAPES = str.maketrans({c: "\\" + c for c in "\\_*[]()~`>#+-=|{}.!"})
+
+
+def md(value) -> str:
+    """Escape a value for use as literal text in a MarkdownV2 message"""
+    return str(value).translate(_MDV2_ESCAPES)
+
+
+# Message templates (MarkdownV2), built once rather than per command.
+# Dynamic fields are passed through md() before formatting.
+WELCOME_MSG = (
+    "*Trench Scan Bot*\n\n"
+    "Your memecoin radar is active\\.\n\n"
+    "*Commands:*\n"
+    "/trending \\- Top trending tickers\n"
+    "/new \\- New discoveries\n"
+    "/stats \\- Overall statistics\n"
+    "/ticker <SYMBOL\\> \\- Ticker details\n"
+    "/help \\- Show help"
+)
+HELP_MSG = (
+    "*Trench Scan Commands*\n\n"
+    "/trending \\- Show top 10 trending tickers by velocity\n"
+    "/new \\- Show newly discovered tickers \\(last 24h\\)\n"
+    "/stats \\- Show overall statistics\n"
+    "/ticker SYMBOL \\- Get details for a specific ticker\n\n"
+    "You'll also receive automatic alerts for:\n"
+    "\\- New ticker discoveries\n"
+    "\\- Velocity spikes\n"
+    "\\- High engagement tweets"
+)
+TRENDING_HEADER = "*Trending Tickers*\n\n"
+TRENDING_ROW = (
+    "{i}\\. *${symbol}*\n"
+    "   1h: {mentions_1h} \\| 24h: {mentions_24h}\n"
+    "   Velocity: {velocity}x \\| Score: {score}\n\n"
+)
+NEW_HEADER = "*New Discoveries \\(24h\\)*\n\n"
+NEW_ROW = "*${symbol}* \\- {mentions} mentions \\(seen at {first_seen:%H:%M}\\)\n"
+
+# Characters of the first tweet quoted in a new-ticker alert
+ALERT_PREVIEW_CHARS = 200
+
+T = TypeVar("T")
+
+
+async def run_in_session(fn: Callable[..., T]) -> T:
+    """Run fn(db) with its own session in a worker thread, off the event loop"""
+
+    def run() -> T:
+        db = SessionLocal()
+        try:
+            return fn(db)
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(run)
+
+
+def command(handler):
+    """
+    Wrap a /command handler: skip updates without a message and log how long
+    the handler took, at WARNING once it passes SLOW_COMMAND_SECONDS.
+    """
+
+    @wraps(handler)
+    async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if not update.message:
+            return
+
+        start = time.perf_counter()
+        try:
+            return await handler(self, update, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            level = logging.WARNING if elapsed > SLOW_COMMAND_SECONDS else logging.DEBUG
+            logger.log(level, "%s took %.0f ms", handler.__name__, elapsed * 1000)
+
+    return wrapper
+
 
 class TelegramBot:
     """Telegram bot for sending alerts and commands"""
@@ -20,17 +115,38 @@ class TelegramBot:
         self.chat_id = settings.telegram_chat_id
         self.app: Optional[Application] = None
         self.bot: Optional[Bot] = None
+        self.webhook_secret = settings.telegram_webhook_secret or secrets.token_urlsafe(32)
+
+        # One limiter shared by command replies and alerts keeps their combined
+        # rate within Telegram's flood limits (30 msg/s overall, 20 msg/min per
+        # group) and waits out any 429 RetryAfter before retrying
+        self.rate_limiter = AIORateLimiter(max_retries=SEND_RETRIES)
 
         if self.token:
-            self.bot = Bot(token=self.token)
+            self.bot = ExtBot(token=self.token, rate_limiter=self.rate_limiter)
+
+    async def start(self, webhook_url: Optional[str] = None):
+        """
+        Start the bot with command handlers.
 
-    async def start(self):
-        """Start the bot with command handlers"""
+        Args:
+            webhook_url: Public base URL of the dashboard. When given, Telegram
+                pushes updates to its /telegram/{secret} route (see
+                process_webhook) instead of the bot polling for them.
+        """
         if not self.token:
             logger.warning("Telegram bot token not configured")
             return
 
-        self.app = Application.builder().token(self.token).build()
+        # Handlers await their queries in worker threads, so let one slow
+        # command overlap with the next instead of queueing behind it
+        self.app = (
+            Application.builder()
+            .token(self.token)
+            .rate_limiter(self.rate_limiter)
+            .concurrent_updates(True)
+            .build()
+        )
 
         # Add command handlers
         self.app.add_handler(CommandHandler("start", self.cmd_start))
@@ -43,172 +159,144 @@ class TelegramBot:
         logger.info("Telegram bot started")
         await self.app.initialize()
         await self.app.start()
-        await self.app.updater.start_polling()
+
+        if webhook_url:
+            await self.app.bot.set_webhook(
+                url=f"{webhook_url.rstrip('/')}/telegram/{self.webhook_secret}",
+                allowed_updates=[Update.MESSAGE],
+            )
+        else:
+            # Long-poll for commands only; getUpdates extends its read
+            # timeout by the poll timeout itself
+            await self.app.updater.start_polling(
+                timeout=POLL_TIMEOUT,
+                bootstrap_retries=-1,
+                allowed_updates=[Update.MESSAGE],
+            )
 
     async def stop(self):
         """Stop the bot"""
         if self.app:
-            await self.app.updater.stop()
+            if self.app.updater.running:
+                await self.app.updater.stop()
             await self.app.stop()
             await self.app.shutdown()
 
+    async def process_webhook(self, data: dict):
+        """Queue an update pushed to the webhook for the handlers"""
+        if not self.app:
+            return
+        await self.app.update_queue.put(Update.de_json(data, self.app.bot))
+
+    @command
     async def cmd_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        if not update.message:
-            return
-        welcome_msg = (
-            "*Trench Scan Bot*\n\n"
-            "Your memecoin radar is active.\n\n"
-            "*Commands:*\n"
-            "/trending - Top trending tickers\n"
-            "/new - New discoveries\n"
-            "/stats - Overall statistics\n"
-            "/ticker <SYMBOL> - Ticker details\n"
-            "/help - Show help"
-        )
-        await update.message.reply_text(welcome_msg, parse_mode="Markdown")
+        await update.message.reply_text(WELCOME_MSG, parse_mode=ParseMode.MARKDOWN_V2)
 
+    @command
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        if not update.message:
-            return
-        help_msg = (
-            "*Trench Scan Commands*\n\n"
-            "/trending - Show top 10 trending tickers by velocity\n"
-            "/new - Show newly discovered tickers (last 24h)\n"
-            "/stats - Show overall statistics\n"
-            "/ticker SYMBOL - Get details for a specific ticker\n\n"
-            "You'll also receive automatic alerts for:\n"
-            "- New ticker discoveries\n"
-            "- Velocity spikes\n"
-            "- High engagement tweets"
-        )
-        await update.message.reply_text(help_msg, parse_mode="Markdown")
+        await update.message.reply_text(HELP_MSG, parse_mode=ParseMode.MARKDOWN_V2)
 
+    @command
     async def cmd_trending(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /trending command"""
-        if not update.message:
-            return
-        db = SessionLocal()
-        try:
-            analyzer = TickerAnalyzer(db)
-            trending = analyzer.calculate_trending(limit=10)
-
-            if not trending:
-                await update.message.reply_text("No trending tickers yet. Run the scraper first.")
-                return
-
-            msg = "*Trending Tickers*\n\n"
-            for i, t in enumerate(trending, 1):
-                velocity_indicator = "+" if t.velocity > 0 else ""
-                msg += (
-                    f"{i}. *${t.symbol}*\n"
-                    f"   1h: {t.mentions_1h} | 24h: {t.mentions_24h}\n"
-                    f"   Velocity: {velocity_indicator}{t.velocity:.1f}x | Score: {t.score:.0f}\n\n"
-                )
-
-            await update.message.reply_text(msg, parse_mode="Markdown")
-        finally:
-            db.close()
+        trending = await run_in_session(
+            lambda db: TickerAnalyzer(db).calculate_trending(limit=10)
+        )
 
-    async def cmd_new(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /new command"""
-        if not update.message:
+        if not trending:
+            await update.message.reply_text("No trending tickers yet. Run the scraper first.")
             return
-        db = SessionLocal()
-        try:
-            analyzer = TickerAnalyzer(db)
-            new_tickers = analyzer.get_new_tickers(hours=24)
 
-            if not new_tickers:
-                await update.message.reply_text("No new tickers discovered in the last 24h.")
-                return
+        msg = TRENDING_HEADER + "".join(
+            TRENDING_ROW.format(
+                i=i,
+                symbol=md(t.symbol),
+                mentions_1h=t.mentions_1h,
+                mentions_24h=t.mentions_24h,
+                velocity=md(f"{'+' if t.velocity > 0 else ''}{t.velocity:.1f}"),
+                score=md(f"{t.score:.0f}"),
+            )
+            for i, t in enumerate(trending, 1)
+        )
 
-            msg = "*New Discoveries (24h)*\n\n"
-            for ticker in new_tickers[:15]:
-                time_str = ticker.first_seen.strftime("%H:%M")
-                msg += f"*${ticker.symbol}* - {ticker.total_mentions} mentions (seen at {time_str})\n"
+        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
 
-            await update.message.reply_text(msg, parse_mode="Markdown")
-        finally:
-            db.close()
+    @command
+    async def cmd_new(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /new command"""
+        new_tickers = await run_in_session(
+            lambda db: TickerAnalyzer(db).get_new_tickers(hours=24, limit=15)
+        )
 
-    async def cmd_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /stats command"""
-        if not update.message:
+        if not new_tickers:
+            await update.message.reply_text("No new tickers discovered in the last 24h.")
             return
-        from sqlalchemy import func
-        from datetime import timedelta
-        from src.database.models import Mention
 
-        db = SessionLocal()
-        try:
-            now = datetime.utcnow()
+        msg = NEW_HEADER + "".join(
+            NEW_ROW.format(
+                symbol=md(ticker.symbol),
+                mentions=ticker.total_mentions,
+                first_seen=ticker.first_seen,
+            )
+            for ticker in new_tickers
+        )
 
-            total_tickers = db.query(func.count(Ticker.id)).scalar()
-            total_mentions = db.query(func.count(Mention.id)).scalar()
+        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
 
-            mentions_1h = (
-                db.query(func.count(Mention.id))
-                .filter(Mention.timestamp >= now - timedelta(hours=1))
-                .scalar()
-            )
+    @command
+    async def cmd_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /stats command"""
+        now = datetime.utcnow()
 
-            mentions_24h = (
-                db.query(func.count(Mention.id))
-                .filter(Mention.timestamp >= now - timedelta(hours=24))
-                .scalar()
-            )
+        stats = await run_in_session(lambda db: TickerAnalyzer(db).get_stats())
 
-            msg = (
-                "*Trench Scan Statistics*\n\n"
-                f"Total Tickers: *{total_tickers}*\n"
-                f"Total Mentions: *{total_mentions}*\n"
-                f"Mentions (1h): *{mentions_1h}*\n"
-                f"Mentions (24h): *{mentions_24h}*\n\n"
-                f"Last updated: {now.strftime('%Y-%m-%d %H:%M UTC')}"
-            )
+        msg = (
+            "*Trench Scan Statistics*\n\n"
+            f"Total Tickers: *{stats['total_tickers']}*\n"
+            f"Total Mentions: *{stats['total_mentions']}*\n"
+            f"Mentions \\(1h\\): *{stats['mentions_1h']}*\n"
+            f"Mentions \\(24h\\): *{stats['mentions_24h']}*\n\n"
+            f"Last updated: {md(f'{now:%Y-%m-%d %H:%M} UTC')}"
+        )
 
-            await update.message.reply_text(msg, parse_mode="Markdown")
-        finally:
-            db.close()
+        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
 
+    @command
     async def cmd_ticker(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ticker <SYMBOL> command"""
-        if not update.message:
-            return
         if not context.args:
             await update.message.reply_text("Usage: /ticker SYMBOL\nExample: /ticker PEPE")
             return
 
         symbol = context.args[0].upper().replace("$", "")
 
-        db = SessionLocal()
-        try:
-            ticker = db.query(Ticker).filter(Ticker.symbol == symbol).first()
-
-            if not ticker:
-                await update.message.reply_text(f"Ticker ${symbol} not found.")
-                return
-
-            msg = (
-                f"*${ticker.symbol}*\n\n"
-                f"First seen: {ticker.first_seen.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Last seen: {ticker.last_seen.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Total mentions: *{ticker.total_mentions}*\n"
-            )
+        ticker = await run_in_session(
+            lambda db: db.query(Ticker).filter(Ticker.symbol == symbol).first()
+        )
 
-            if ticker.contract_address:
-                msg += f"Contract: `{ticker.contract_address}`\n"
-            if ticker.chain:
-                msg += f"Chain: {ticker.chain}\n"
+        if not ticker:
+            await update.message.reply_text(f"Ticker ${symbol} not found.")
+            return
 
-            await update.message.reply_text(msg, parse_mode="Markdown")
-        finally:
-            db.close()
+        parts = [
+            f"*${md(ticker.symbol)}*\n\n"
+            f"First seen: {md(f'{ticker.first_seen:%Y-%m-%d %H:%M}')}\n"
+            f"Last seen: {md(f'{ticker.last_seen:%Y-%m-%d %H:%M}')}\n"
+            f"Total mentions: *{ticker.total_mentions}*\n"
+        ]
+        if ticker.contract_address:
+            # Addresses are base58/hex, so nothing in them needs escaping in code spans
+            parts.append(f"Contract: `{ticker.contract_address}`\n")
+        if ticker.chain:
+            parts.append(f"Chain: {md(ticker.chain)}\n")
+        msg = "".join(parts)
+
+        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
 
     async def send_alert(self, message: str, chat_id: Optional[str] = None):
-        """Send an alert message to the configured chat"""
+        """Send an alert message (MarkdownV2, see md()) to the configured chat"""
         if not self.bot:
             logger.warning("Cannot send alert - bot not configured")
             return
@@ -222,7 +310,7 @@ class TelegramBot:
             await self.bot.send_message(
                 chat_id=target_chat,
                 text=message,
-                parse_mode="Markdown",
+                parse_mode=ParseMode.MARKDOWN_V2,
                 disable_web_page_preview=True,
             )
             logger.info(f"Alert sent to chat {target_chat}")
@@ -233,9 +321,10 @@ class TelegramBot:
         """Send alert for newly discovered ticker"""
         msg = (
             f"*NEW TICKER DETECTED*\n\n"
-            f"*${ticker.symbol}*\n\n"
-            f"_{first_tweet_text[:200]}{'...' if len(first_tweet_text) > 200 else ''}_\n\n"
-            f"First seen: {ticker.first_seen.strftime('%H:%M UTC')}"
+            f"*${md(ticker.symbol)}*\n\n"
+            f"_{md(first_tweet_text[:ALERT_PREVIEW_CHARS])}"
+            f"{md('...') if len(first_tweet_text) > ALERT_PREVIEW_CHARS else ''}_\n\n"
+            f"First seen: {ticker.first_seen:%H:%M UTC}"
         )
         await self.send_alert(msg)
 
@@ -243,10 +332,10 @@ class TelegramBot:
         """Send alert for trending ticker"""
         msg = (
             f"*TRENDING ALERT*\n\n"
-            f"*${ticker.symbol}* is gaining momentum!\n\n"
-            f"Mentions (1h): {ticker.mentions_1h}\n"
-            f"Mentions (24h): {ticker.mentions_24h}\n"
-            f"Velocity: +{ticker.velocity:.1f}x\n"
-            f"Score: {ticker.score:.0f}"
+            f"*${md(ticker.symbol)}* is gaining momentum\\!\n\n"
+            f"Mentions \\(1h\\): {ticker.mentions_1h}\n"
+            f"Mentions \\(24h\\): {ticker.mentions_24h}\n"
+            f"Velocity: {md(f'+{ticker.velocity:.1f}')}x\n"
+            f"Score: {md(f'{ticker.score:.0f}')}"
         )
         await self.send_alert(msg)
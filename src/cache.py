@@ -0,0 +1,61 @@
+import threading
+import time
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Maximum number of cached entries; the soonest-expiring ones are evicted first
+MAXSIZE = 256
+
+_entries: dict[Hashable, tuple[float, Any]] = {}
+_key_locks: dict[Hashable, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def cached(key: Hashable, ttl: float, fn: Callable[[], T]) -> T:
+    """
+    Return the cached value for key, calling fn to compute it when missing or stale.
+
+    Concurrent callers that miss on the same key wait for the first one's
+    result instead of all running fn.
+
+    Args:
+        key: Cache key, e.g. ("trending", limit)
+        ttl: Seconds the computed value stays fresh
+        fn: Computes the value on a miss
+    """
+    entry = _entries.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    try:
+        with key_lock:
+            # Another caller may have filled it while we waited
+            entry = _entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = fn()
+            with _lock:
+                if len(_entries) >= MAXSIZE and key not in _entries:
+                    oldest = min(_entries, key=lambda k: _entries[k][0])
+                    del _entries[oldest]
+                _entries[key] = (time.monotonic() + ttl, value)
+            return value
+    finally:
+        # Only keep locks for keys being computed right now, so the lock
+        # table stays bounded however many distinct keys are requested
+        with _lock:
+            if _key_locks.get(key) is key_lock and not key_lock.locked():
+                del _key_locks[key]
+
+
+def invalidate():
+    """Drop every cached value, e.g. once a scrape cycle has stored new data"""
+    with _lock:
+        _entries.clear()
+        for key in [k for k, lock in _key_locks.items() if not lock.locked()]:
+            del _key_locks[key]
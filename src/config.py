@@ -1,15 +1,23 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
     # Database
     database_url: str = Field(default="sqlite:///./trench_scan.db")
+    db_pool_size: int = Field(default=20)  # Pooled connections (non-SQLite only)
+    db_max_overflow: int = Field(default=40)  # Extra connections allowed under burst load
+    db_pool_timeout: int = Field(default=10)  # Seconds to wait for a free connection
+    db_pool_recycle: int = Field(default=1800)  # Seconds before a connection is replaced
 
     # Telegram Bot
     telegram_bot_token: Optional[str] = Field(default=None)
     telegram_chat_id: Optional[str] = Field(default=None)
+    telegram_webhook_url: Optional[str] = Field(default=None)  # Public dashboard URL; enables webhooks in `run`
+    telegram_webhook_secret: Optional[str] = Field(default=None)  # Webhook path secret (random if unset)
 
     # Discord Bot
     discord_bot_token: Optional[str] = Field(default=None)
@@ -18,15 +26,21 @@ class Settings(BaseSettings):
     # RapidAPI (Twitter scraping)
     rapidapi_key: Optional[str] = Field(default=None)
     rapidapi_host: str = Field(default="twitterapi-cheap.p.rapidapi.com")
+    twitter_concurrency: int = Field(default=8)  # Max concurrent search requests
 
     # Scraper Settings
+    scrape_mode: Literal["pumpfun", "twitter"] = Field(default="pumpfun")  # Token source for each cycle
     scrape_interval_minutes: int = Field(default=5)
     min_mentions_threshold: int = Field(default=3)
     trending_velocity_threshold: int = Field(default=5)
 
+    # Analyzer Settings
+    extract_parallel: bool = Field(default=False)  # Scan large tweet batches in worker processes
+    extract_batch_size: int = Field(default=500)  # Tweets per worker chunk
+
     # Search Keywords for crypto/memecoin tweets
-    search_keywords: list[str] = Field(
-        default=[
+    search_keywords: tuple[str, ...] = Field(
+        default=(
             "$",  # Ticker symbol prefix
             "memecoin",
             "100x",
@@ -39,11 +53,11 @@ class Settings(BaseSettings):
             "sol",
             "eth",
             "base",
-        ]
+        )
     )
 
     # Accounts to monitor (crypto influencers, alpha callers)
-    watch_accounts: list[str] = Field(default=[])
+    watch_accounts: tuple[str, ...] = Field(default=())
 
     # Dashboard
     dashboard_host: str = Field(default="127.0.0.1")
@@ -54,4 +68,10 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process"""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,17 +1,19 @@
 import logging
-from datetime import datetime, timedelta
+import secrets
+from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, Request, Depends
-from fastapi.responses import HTMLResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from src.database.models import get_db, Ticker, Mention, TrendSnapshot
 from src.analyzer.ticker import TickerAnalyzer
 from src.config import settings
+from src.cache import cached
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,20 @@ BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 
+# Seconds serialized API responses are served from cache; scrape cycles
+# invalidate them sooner
+TRENDING_TTL = 60
+STATS_TTL = 30
+TICKER_TTL = 15
+
+# The rendered dashboard only changes when the scraper runs
+DASHBOARD_TTL = settings.scrape_interval_minutes * 60
+
+
+def json_response(body: bytes) -> Response:
+    """Wrap JSON that is already serialized, skipping FastAPI's encoding pass"""
+    return Response(content=body, media_type="application/json")
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
@@ -28,8 +44,12 @@ def create_app() -> FastAPI:
         title="Trench Scan",
         description="Viral Trend Scraper for Memecoin Detection",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
 
+    # Set by the bot when it receives updates by webhook (see main.run_telegram_bot)
+    app.state.telegram_bot = None
+
     # Create directories if they don't exist
     TEMPLATES_DIR.mkdir(exist_ok=True)
     STATIC_DIR.mkdir(exist_ok=True)
@@ -37,48 +57,45 @@ def create_app() -> FastAPI:
     # Setup templates
     templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+    # Endpoints are plain defs so FastAPI runs their blocking session queries
+    # in its threadpool rather than on the event loop
+
     @app.get("/", response_class=HTMLResponse)
-    async def dashboard(request: Request, db: Session = Depends(get_db)):
+    def dashboard(db: Session = Depends(get_db)):
         """Main dashboard view"""
+        return HTMLResponse(cached(("dashboard",), DASHBOARD_TTL, lambda: render_dashboard(db)))
+
+    def render_dashboard(db: Session) -> str:
         analyzer = TickerAnalyzer(db)
 
         # Get trending tickers
         trending = analyzer.calculate_trending(limit=20)
 
         # Get new tickers (last 24h)
-        new_tickers = analyzer.get_new_tickers(hours=24)
+        new_tickers = analyzer.get_new_tickers(hours=24, limit=15)
 
         # Get stats
-        total_tickers = db.query(func.count(Ticker.id)).scalar()
-        total_mentions = db.query(func.count(Mention.id)).scalar()
-
+        stats = analyzer.get_stats()
         now = datetime.utcnow()
-        mentions_24h = (
-            db.query(func.count(Mention.id))
-            .filter(Mention.timestamp >= now - timedelta(hours=24))
-            .scalar()
-        )
 
-        return templates.TemplateResponse(
-            "dashboard.html",
-            {
-                "request": request,
-                "trending": trending,
-                "new_tickers": new_tickers,
-                "stats": {
-                    "total_tickers": total_tickers,
-                    "total_mentions": total_mentions,
-                    "mentions_24h": mentions_24h,
-                },
-                "last_updated": now.strftime("%Y-%m-%d %H:%M UTC"),
-            },
+        return templates.get_template("dashboard.html").render(
+            trending=trending,
+            new_tickers=new_tickers,
+            stats=stats,
+            last_updated=now.strftime("%Y-%m-%d %H:%M UTC"),
         )
 
     @app.get("/api/trending")
-    async def api_trending(limit: int = 20, db: Session = Depends(get_db)):
+    def api_trending(limit: int = 20, db: Session = Depends(get_db)):
         """API endpoint for trending tickers"""
-        analyzer = TickerAnalyzer(db)
-        trending = analyzer.calculate_trending(limit=limit)
+        # Clamp so arbitrary limits can't each take a cache slot
+        limit = max(1, min(limit, 100))
+        return json_response(cached(
+            ("trending", limit), TRENDING_TTL, lambda: orjson.dumps(trending_payload(db, limit))
+        ))
+
+    def trending_payload(db: Session, limit: int) -> dict:
+        trending = TickerAnalyzer(db).calculate_trending(limit=limit)
 
         return {
             "trending": [
@@ -88,7 +105,7 @@ def create_app() -> FastAPI:
                     "mentions_24h": t.mentions_24h,
                     "velocity": round(t.velocity, 2),
                     "score": round(t.score, 2),
-                    "first_seen": t.first_seen.isoformat(),
+                    "first_seen": t.first_seen,
                     "latest_tweet": {
                         "text": t.latest_tweet.text if t.latest_tweet else None,
                         "url": t.latest_tweet.url if t.latest_tweet else None,
@@ -97,13 +114,19 @@ def create_app() -> FastAPI:
                 }
                 for t in trending
             ],
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow(),
         }
 
     @app.get("/api/ticker/{symbol}")
-    async def api_ticker_detail(symbol: str, db: Session = Depends(get_db)):
+    def api_ticker_detail(symbol: str, db: Session = Depends(get_db)):
         """Get detailed info for a specific ticker"""
-        ticker = db.query(Ticker).filter(Ticker.symbol == symbol.upper()).first()
+        symbol = symbol.upper()
+        return json_response(cached(
+            ("ticker", symbol), TICKER_TTL, lambda: orjson.dumps(ticker_payload(db, symbol))
+        ))
+
+    def ticker_payload(db: Session, symbol: str) -> dict:
+        ticker = db.query(Ticker).filter(Ticker.symbol == symbol).first()
 
         if not ticker:
             return {"error": "Ticker not found"}
@@ -129,8 +152,8 @@ def create_app() -> FastAPI:
         return {
             "ticker": {
                 "symbol": ticker.symbol,
-                "first_seen": ticker.first_seen.isoformat(),
-                "last_seen": ticker.last_seen.isoformat(),
+                "first_seen": ticker.first_seen,
+                "last_seen": ticker.last_seen,
                 "total_mentions": ticker.total_mentions,
                 "contract_address": ticker.contract_address,
                 "chain": ticker.chain,
@@ -142,13 +165,13 @@ def create_app() -> FastAPI:
                     "author": m.author_username,
                     "likes": m.likes,
                     "retweets": m.retweets,
-                    "timestamp": m.timestamp.isoformat(),
+                    "timestamp": m.timestamp,
                 }
                 for m in mentions
             ],
             "trend_history": [
                 {
-                    "timestamp": s.timestamp.isoformat(),
+                    "timestamp": s.timestamp,
                     "mentions_1h": s.mentions_1h,
                     "score": round(s.score, 2),
                 }
@@ -157,39 +180,26 @@ def create_app() -> FastAPI:
         }
 
     @app.get("/api/stats")
-    async def api_stats(db: Session = Depends(get_db)):
+    def api_stats(db: Session = Depends(get_db)):
         """Get overall statistics"""
-        now = datetime.utcnow()
-
-        total_tickers = db.query(func.count(Ticker.id)).scalar()
-        total_mentions = db.query(func.count(Mention.id)).scalar()
-
-        new_tickers_24h = (
-            db.query(func.count(Ticker.id))
-            .filter(Ticker.first_seen >= now - timedelta(hours=24))
-            .scalar()
-        )
-
-        mentions_1h = (
-            db.query(func.count(Mention.id))
-            .filter(Mention.timestamp >= now - timedelta(hours=1))
-            .scalar()
-        )
-
-        mentions_24h = (
-            db.query(func.count(Mention.id))
-            .filter(Mention.timestamp >= now - timedelta(hours=24))
-            .scalar()
-        )
-
-        return {
-            "total_tickers": total_tickers,
-            "total_mentions": total_mentions,
-            "new_tickers_24h": new_tickers_24h,
-            "mentions_1h": mentions_1h,
-            "mentions_24h": mentions_24h,
-            "updated_at": now.isoformat(),
-        }
+        return json_response(cached(
+            ("stats",), STATS_TTL, lambda: orjson.dumps(stats_payload(db))
+        ))
+
+    def stats_payload(db: Session) -> dict:
+        stats = TickerAnalyzer(db).get_stats()
+        stats["updated_at"] = datetime.utcnow()
+        return stats
+
+    @app.post("/telegram/{secret}")
+    async def telegram_webhook(secret: str, request: Request):
+        """Receive updates pushed by Telegram"""
+        bot = app.state.telegram_bot
+        if bot is None or not secrets.compare_digest(secret, bot.webhook_secret):
+            raise HTTPException(status_code=404)
+
+        await bot.process_webhook(await request.json())
+        return {"ok": True}
 
     return app
 
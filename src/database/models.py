@@ -1,3 +1,5 @@
+import io
+
 from sqlalchemy import (
     Column,
     Integer,
@@ -5,11 +7,19 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Text,
     Boolean,
+    bindparam,
     create_engine,
+    event,
+    insert,
+    update,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
 from datetime import datetime
 
 from src.config import settings
@@ -24,11 +34,11 @@ class Ticker(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     symbol = Column(String(50), unique=True, nullable=False, index=True)
-    first_seen = Column(DateTime, default=datetime.utcnow)
+    first_seen = Column(DateTime, default=datetime.utcnow, index=True)
     last_seen = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     total_mentions = Column(Integer, default=0)
     is_known_coin = Column(Boolean, default=False)  # BTC, ETH, SOL etc.
-    contract_address = Column(String(100), nullable=True)
+    contract_address = Column(String(100), nullable=True, index=True)
     chain = Column(String(20), nullable=True)  # solana, eth, base, etc.
 
     mentions = relationship("Mention", back_populates="ticker")
@@ -42,6 +52,12 @@ class Mention(Base):
     """Individual tweet mentions of a ticker"""
 
     __tablename__ = "mentions"
+    __table_args__ = (
+        # Per-ticker history, newest first
+        Index("ix_mentions_ticker_ts", "ticker_id", "timestamp"),
+        # Time-window counts, answerable from the index alone
+        Index("ix_mentions_ts_ticker", "timestamp", "ticker_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     ticker_id = Column(Integer, ForeignKey("tickers.id"), nullable=False)
@@ -65,10 +81,11 @@ class TrendSnapshot(Base):
     """Point-in-time snapshot of ticker trending data"""
 
     __tablename__ = "trend_snapshots"
+    __table_args__ = (Index("ix_snapshots_ticker_ts", "ticker_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     ticker_id = Column(Integer, ForeignKey("tickers.id"), nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
     mentions_1h = Column(Integer, default=0)  # Mentions in last hour
     mentions_24h = Column(Integer, default=0)  # Mentions in last 24h
     velocity = Column(Float, default=0.0)  # Rate of change
@@ -94,15 +111,181 @@ class Alert(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+# Row count from which PostgreSQL (psycopg2) inserts use COPY instead of executemany
+COPY_THRESHOLD = 1000
+
+# Compiled SQL kept per engine (SQLAlchemy's default is 500), room for every
+# distinct statement the scraper, dashboard and bot issue
+QUERY_CACHE_SIZE = 1200
+
+
+def _create_engine():
+    """Create the engine, sizing the connection pool for server databases"""
+    url = make_url(settings.database_url)
+
+    if url.get_backend_name() == "sqlite":
+        # Dashboard and bot queries run in worker threads, so connections
+        # can't be tied to the thread that opened them. An in-memory database
+        # only exists on one connection, so it gets a single shared one.
+        kwargs = {"connect_args": {"check_same_thread": False}}
+        if url.database in (None, "", ":memory:"):
+            kwargs["poolclass"] = StaticPool
+        return create_engine(url, echo=False, query_cache_size=QUERY_CACHE_SIZE, **kwargs)
+
+    return create_engine(
+        url,
+        echo=False,
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
 # Database setup
-engine = create_engine(settings.database_url, echo=False)
+engine = _create_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so dashboard reads don't block behind scraper writes"""
+    if engine.dialect.name != "sqlite":
+        return
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # SQLite auto-checkpoints the WAL at 1000 pages (~4 MB); after a
+    # checkpoint, trim the file back to 8 MiB so one large write can't leave
+    # it permanently bloated
+    cursor.execute("PRAGMA journal_size_limit=8388608")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-32000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Memory-map the file so hot pages are read without a syscall per page
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so add any indexes that
+    # were introduced after an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def insert_ignore(db: Session, model, rows: list[dict], index_elements: list[str]):
+    """
+    Insert rows in one executemany, skipping rows that conflict on a unique key.
+
+    Args:
+        db: Session to execute in (the caller commits)
+        model: Mapped class to insert into
+        rows: Column values for each row
+        index_elements: Unique columns that identify a conflicting row
+    """
+    if not rows:
+        return
+
+    if len(rows) >= COPY_THRESHOLD and engine.dialect.driver == "psycopg2":
+        _copy_insert_ignore(db, model.__table__, rows, index_elements)
+        return
+
+    if engine.dialect.name == "sqlite":
+        stmt = sqlite.insert(model.__table__).on_conflict_do_nothing(index_elements=index_elements)
+    elif engine.dialect.name == "postgresql":
+        stmt = postgresql.insert(model.__table__).on_conflict_do_nothing(index_elements=index_elements)
+    else:
+        stmt = insert(model.__table__)
+
+    db.execute(stmt, rows)
+
+
+def _copy_insert_ignore(db: Session, table, rows: list[dict], index_elements: list[str]):
+    """
+    Load rows with PostgreSQL COPY into a temp table, then insert-ignore them.
+
+    COPY can't skip conflicting rows itself, so it fills a scratch copy of the
+    table and a single INSERT ... SELECT ... ON CONFLICT DO NOTHING moves
+    the rows across.
+    """
+    # Client-side defaults (e.g. created_at) don't exist in the database, so
+    # fill them in for any column the rows leave out
+    defaults = {}
+    for column in table.columns:
+        if column.name in rows[0] or column.default is None or column.primary_key:
+            continue
+        if column.default.is_callable:
+            defaults[column.name] = column.default.arg(None)
+        elif column.default.is_scalar:
+            defaults[column.name] = column.default.arg
+    row_columns = list(rows[0])
+    columns = row_columns + list(defaults)
+
+    # Quote every value so empty strings stay distinct from NULL (unquoted empty)
+    def csv_field(value) -> str:
+        if value is None:
+            return ""
+        return '"' + str(value).replace('"', '""') + '"'
+
+    default_fields = [csv_field(v) for v in defaults.values()]
+    buf = io.StringIO()
+    for row in rows:
+        fields = [csv_field(row[c]) for c in row_columns] + default_fields
+        buf.write(",".join(fields) + "\n")
+    buf.seek(0)
+
+    column_list = ", ".join(columns)
+    staging = f"_copy_{table.name}"
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table.name} WITH NO DATA"
+        )
+        cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv)", buf)
+        cursor.execute(
+            f"INSERT INTO {table.name} ({column_list}) "
+            f"SELECT {column_list} FROM {staging} "
+            f"ON CONFLICT ({', '.join(index_elements)}) DO NOTHING"
+        )
+        cursor.execute(f"DROP TABLE {staging}")
+    finally:
+        cursor.close()
+
+
+def increment_mention_counts(db: Session, counts: dict[int, int]):
+    """
+    Add to tickers' total_mentions and bump last_seen in one executemany UPDATE.
+
+    Args:
+        db: Session to execute in (the caller commits)
+        counts: Number of new mentions per ticker id
+    """
+    if not counts:
+        return
+
+    tickers = Ticker.__table__
+    stmt = (
+        update(tickers)
+        .where(tickers.c.id == bindparam("ticker_id"))
+        .values(
+            total_mentions=tickers.c.total_mentions + bindparam("new_mentions"),
+            last_seen=datetime.utcnow(),
+        )
+    )
+    db.execute(stmt, [
+        {"ticker_id": ticker_id, "new_mentions": n}
+        for ticker_id, n in counts.items()
+    ])
+
 
 def get_db():
     """Get database session"""
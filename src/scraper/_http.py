@@ -0,0 +1,59 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+# Requests allowed in flight to any one host at a time, across all scrapers
+MAX_REQUESTS_PER_HOST = 64
+
+# One pooled HTTP/2 client for every scraper, so connections (and their TLS
+# handshakes) are reused across scrapers and scrape cycles
+_client: Optional[httpx.AsyncClient] = None
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that caps concurrent requests per host"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int = MAX_REQUESTS_PER_HOST):
+        self.transport = transport
+        self.limit = limit
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self.semaphores.setdefault(request.url.host, asyncio.Semaphore(self.limit))
+        async with semaphore:
+            response = await self.transport.handle_async_request(request)
+            # Read the body before giving the slot back
+            await response.aread()
+            return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared scraper HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=HostLimitedTransport(httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=300,
+                ),
+                # Retry failed connection attempts (never a sent request)
+                retries=2,
+            )),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared client; the next get_client() opens a fresh one"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,14 +1,18 @@
+import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
+import sys
+from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
 
-import httpx
+import orjson
+
+from src.scraper._http import get_client
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DexToken:
     """Represents a token from DexScreener"""
 
@@ -30,8 +34,15 @@ class DexScreenerScraper:
 
     BASE_URL = "https://api.dexscreener.com"
 
+    # Fixed request targets, built once rather than per call
+    PROFILES_URL = f"{BASE_URL}/token-profiles/latest/v1"
+    PROFILES_PARAMS = {"chainId": "solana"}
+    BOOSTS_URL = f"{BASE_URL}/token-boosts/latest/v1"
+    SEARCH_URL = f"{BASE_URL}/dex/search"
+    TOKENS_URL = f"{BASE_URL}/dex/tokens/"
+
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_client()
 
     async def get_new_solana_tokens(
         self,
@@ -44,40 +55,45 @@ class DexScreenerScraper:
         Args:
             limit: Maximum number of tokens to fetch
             max_age_hours: Only return tokens created within this many hours
+                (unused: the profile and boost feeds are latest-first and
+                carry no creation time to filter on)
 
         Returns:
             List of DexToken objects
         """
+        # Boosted tokens are only needed when profiles come up short, but
+        # requesting them up front overlaps the two round trips
+        boosted_task = asyncio.create_task(self._get_from_boosted(limit, max_age_hours))
+
         try:
             # Get latest token profiles (new listings)
             response = await self.client.get(
-                f"{self.BASE_URL}/token-profiles/latest/v1",
-                params={"chainId": "solana"},
+                self.PROFILES_URL,
+                params=self.PROFILES_PARAMS,
             )
 
             if response.status_code != 200:
                 logger.warning(f"DexScreener profiles API error: {response.status_code}")
-                # Try alternative endpoint
-                return await self._get_from_boosted(limit, max_age_hours)
+                # Fall back to the boosted endpoint
+                return await boosted_task
 
-            data = response.json()
+            data = orjson.loads(response.content)
             tokens = []
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+            now = datetime.now(timezone.utc)
 
             for item in data[:limit]:
-                token = self._parse_profile(item)
+                # Skip malformed items rather than losing the whole listing
+                if not item or not isinstance(item, dict):
+                    continue
+                token = self._parse_profile(item, now)
                 # Only include tokens with valid symbol data
-                if token and token.symbol and token.symbol != "???":
+                if token.symbol and token.symbol != "???":
                     tokens.append(token)
 
-            # Filter by age if we have timestamp info
-            if tokens and tokens[0].created_timestamp:
-                tokens = [t for t in tokens if t.created_timestamp >= cutoff_time]
-
             # If we got too few tokens with valid data, try boosted endpoint
             if len(tokens) < 10:
                 logger.info(f"Only {len(tokens)} valid tokens from profiles, trying boosted...")
-                boosted = await self._get_from_boosted(limit, max_age_hours)
+                boosted = await boosted_task
                 # Add boosted tokens that aren't duplicates
                 seen_addresses = {t.address for t in tokens}
                 for bt in boosted:
@@ -91,26 +107,30 @@ class DexScreenerScraper:
         except Exception as e:
             logger.error(f"Failed to fetch DexScreener tokens: {e}")
             return []
+        finally:
+            # Drop the boosted request if profiles were enough (no-op once done)
+            boosted_task.cancel()
 
     async def _get_from_boosted(self, limit: int, max_age_hours: int) -> list[DexToken]:
         """Fallback: Get from boosted tokens endpoint"""
         try:
             response = await self.client.get(
-                f"{self.BASE_URL}/token-boosts/latest/v1",
+                self.BOOSTS_URL,
             )
 
             if response.status_code != 200:
                 logger.error(f"DexScreener boosts API error: {response.status_code}")
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             tokens = []
+            now = datetime.now(timezone.utc)
 
             for item in data[:limit]:
-                if item.get("chainId") == "solana":
-                    token = self._parse_boost(item)
+                if isinstance(item, dict) and item.get("chainId") == "solana":
+                    token = self._parse_boost(item, now)
                     # Only include tokens with valid symbol data
-                    if token and token.symbol and token.symbol != "???":
+                    if token.symbol and token.symbol != "???":
                         tokens.append(token)
 
             logger.info(f"Found {len(tokens)} boosted Solana tokens on DexScreener")
@@ -132,22 +152,16 @@ class DexScreenerScraper:
         """
         try:
             response = await self.client.get(
-                f"{self.BASE_URL}/dex/search",
+                self.SEARCH_URL,
                 params={"q": query},
             )
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
-            tokens = []
-
-            for pair in data.get("pairs", [])[:10]:
-                token = self._parse_pair(pair)
-                if token:
-                    tokens.append(token)
-
-            return tokens
+            data = orjson.loads(response.content)
+            tokens = [self._parse_pair(pair) for pair in data.get("pairs", [])[:10]]
+            return [t for t in tokens if t is not None]
 
         except Exception as e:
             logger.error(f"DexScreener search failed: {e}")
@@ -165,13 +179,13 @@ class DexScreenerScraper:
         """
         try:
             response = await self.client.get(
-                f"{self.BASE_URL}/dex/tokens/{address}",
+                self.TOKENS_URL + address,
             )
 
             if response.status_code != 200:
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
             pairs = data.get("pairs", [])
 
             if not pairs:
@@ -184,45 +198,37 @@ class DexScreenerScraper:
             logger.error(f"Failed to get token info: {e}")
             return None
 
-    def _parse_profile(self, data: dict) -> Optional[DexToken]:
-        """Parse token profile data"""
-        try:
-            return DexToken(
-                address=data.get("tokenAddress", ""),
-                name=data.get("name", "Unknown"),
-                symbol=data.get("symbol", "???"),
-                chain=data.get("chainId", "solana"),
-                created_timestamp=datetime.now(timezone.utc),  # Profiles don't have timestamp
-                price_usd=0,
-                liquidity_usd=0,
-                volume_24h=0,
-                price_change_24h=0,
-                txns_24h=0,
-                dex_url=data.get("url", ""),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse profile: {e}")
-            return None
-
-    def _parse_boost(self, data: dict) -> Optional[DexToken]:
-        """Parse boosted token data"""
-        try:
-            return DexToken(
-                address=data.get("tokenAddress", ""),
-                name=data.get("name", "Unknown"),
-                symbol=data.get("symbol", "???"),
-                chain=data.get("chainId", "solana"),
-                created_timestamp=datetime.now(timezone.utc),
-                price_usd=0,
-                liquidity_usd=0,
-                volume_24h=0,
-                price_change_24h=0,
-                txns_24h=0,
-                dex_url=data.get("url", ""),
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse boost: {e}")
-            return None
+    def _parse_profile(self, data: dict, now: datetime) -> DexToken:
+        """Parse token profile data, stamped with the response's fetch time"""
+        return DexToken(
+            address=data.get("tokenAddress", ""),
+            name=data.get("name", "Unknown"),
+            symbol=sys.intern(str(data.get("symbol") or "???")),
+            chain=sys.intern(str(data.get("chainId") or "solana")),
+            created_timestamp=now,  # Profiles don't have timestamp
+            price_usd=0,
+            liquidity_usd=0,
+            volume_24h=0,
+            price_change_24h=0,
+            txns_24h=0,
+            dex_url=data.get("url", ""),
+        )
+
+    def _parse_boost(self, data: dict, now: datetime) -> DexToken:
+        """Parse boosted token data, stamped with the response's fetch time"""
+        return DexToken(
+            address=data.get("tokenAddress", ""),
+            name=data.get("name", "Unknown"),
+            symbol=sys.intern(str(data.get("symbol") or "???")),
+            chain=sys.intern(str(data.get("chainId") or "solana")),
+            created_timestamp=now,
+            price_usd=0,
+            liquidity_usd=0,
+            volume_24h=0,
+            price_change_24h=0,
+            txns_24h=0,
+            dex_url=data.get("url", ""),
+        )
 
     def _parse_pair(self, data: dict) -> Optional[DexToken]:
         """Parse pair data from search/token endpoints"""
@@ -242,8 +248,8 @@ class DexScreenerScraper:
             return DexToken(
                 address=base_token.get("address", ""),
                 name=base_token.get("name", "Unknown"),
-                symbol=base_token.get("symbol", "???"),
-                chain=data.get("chainId", "solana"),
+                symbol=sys.intern(str(base_token.get("symbol") or "???")),
+                chain=sys.intern(str(data.get("chainId") or "solana")),
                 created_timestamp=created_time,
                 price_usd=float(data.get("priceUsd", 0) or 0),
                 liquidity_usd=float(data.get("liquidity", {}).get("usd", 0) or 0),
@@ -258,5 +264,4 @@ class DexScreenerScraper:
             return None
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed once at shutdown (see _http.close_client)"""
@@ -1,14 +1,19 @@
+import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
+import sys
+import time
+from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
 
-import httpx
+import orjson
+
+from src.scraper._http import get_client
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PumpFunToken:
     """Represents a token from pump.fun"""
 
@@ -41,8 +46,32 @@ class PumpFunScraper:
         "Referer": "https://pump.fun/",
     }
 
+    # Tokens requested per page; larger limits are fetched as concurrent pages
+    PAGE_SIZE = 50
+
+    # Fixed request targets and query params, built once rather than per call
+    COINS_URL = f"{BASE_URL}/coins"
+    KING_OF_HILL_URL = f"{BASE_URL}/coins/king-of-the-hill"
+    NEW_TOKENS_ENDPOINTS = (
+        COINS_URL,
+        "https://client-api-2-74b1891ee9f9.herokuapp.com/coins",
+    )
+    NEW_TOKENS_PARAMS = {
+        "sort": "created_timestamp",
+        "order": "DESC",
+        "includeNsfw": "false",
+    }
+    KING_OF_HILL_PARAMS = {"includeNsfw": "false"}
+    SEARCH_PARAMS = {
+        "limit": 20,
+        "sort": "market_cap",
+        "order": "DESC",
+    }
+
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0, headers=self.HEADERS)
+        self.client = get_client()
+        # Endpoint that last returned new tokens; tried first next time
+        self.preferred_endpoint = self.NEW_TOKENS_ENDPOINTS[0]
 
     async def get_new_tokens(
         self,
@@ -59,40 +88,58 @@ class PumpFunScraper:
         Returns:
             List of PumpFunToken objects
         """
-        # Try multiple endpoints
-        endpoints = [
-            f"{self.BASE_URL}/coins",
-            "https://client-api-2-74b1891ee9f9.herokuapp.com/coins",
+        page_params = [
+            {
+                **self.NEW_TOKENS_PARAMS,
+                "offset": offset,
+                "limit": min(self.PAGE_SIZE, limit - offset),
+            }
+            for offset in range(0, limit, self.PAGE_SIZE)
         ]
 
+        # Try the last working endpoint first, then fall back to the others
+        endpoints = [self.preferred_endpoint]
+        endpoints += [e for e in self.NEW_TOKENS_ENDPOINTS if e != self.preferred_endpoint]
+
         for endpoint in endpoints:
             try:
-                response = await self.client.get(
-                    endpoint,
-                    params={
-                        "offset": 0,
-                        "limit": limit,
-                        "sort": "created_timestamp",
-                        "order": "DESC",
-                        "includeNsfw": "false",
-                    },
+                # Fetch all pages at once; over HTTP/2 they share one connection
+                responses = await asyncio.gather(
+                    *(self.client.get(endpoint, params=params, headers=self.HEADERS) for params in page_params)
                 )
 
-                if response.status_code != 200:
-                    logger.warning(f"Pump.fun endpoint {endpoint} returned: {response.status_code}")
+                failed = [r.status_code for r in responses if r.status_code != 200]
+                if failed:
+                    logger.warning(f"Pump.fun endpoint {endpoint} returned: {failed[0]}")
                     continue
 
-                data = response.json()
+                # Pages are decoded lazily, in order, so pages past the cutoff are never parsed
+                data = (item for response in responses for item in orjson.loads(response.content))
                 tokens = []
-                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+                seen = set()
+                cutoff = time.time() - max_age_hours * 3600
 
+                # Check the raw epoch before building datetimes; coins come
+                # newest first, so the first one past the cutoff ends the scan
                 for item in data:
+                    if not item:
+                        continue
+                    # Offset pages can overlap when new coins launch between requests
+                    mint = item.get("mint")
+                    if mint:
+                        if mint in seen:
+                            continue
+                        seen.add(mint)
+                    created_ts = self._epoch_seconds(item.get("created_timestamp"))
+                    if created_ts is not None and created_ts < cutoff:
+                        break
                     token = self._parse_token(item)
-                    if token and token.created_timestamp >= cutoff_time:
+                    if token:
                         tokens.append(token)
 
                 if tokens:
                     logger.info(f"Found {len(tokens)} new pump.fun tokens (last {max_age_hours}h)")
+                    self.preferred_endpoint = endpoint
                     return tokens
 
             except Exception as e:
@@ -111,15 +158,16 @@ class PumpFunScraper:
         """
         try:
             response = await self.client.get(
-                f"{self.BASE_URL}/coins/king-of-the-hill",
-                params={"includeNsfw": "false"},
+                self.KING_OF_HILL_URL,
+                params=self.KING_OF_HILL_PARAMS,
+                headers=self.HEADERS,
             )
 
             if response.status_code != 200:
                 logger.error(f"Pump.fun API error: {response.status_code}")
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             tokens = [self._parse_token(item) for item in data if item]
             tokens = [t for t in tokens if t is not None]
 
@@ -142,19 +190,15 @@ class PumpFunScraper:
         """
         try:
             response = await self.client.get(
-                f"{self.BASE_URL}/coins",
-                params={
-                    "searchTerm": query,
-                    "limit": 20,
-                    "sort": "market_cap",
-                    "order": "DESC",
-                },
+                self.COINS_URL,
+                params={**self.SEARCH_PARAMS, "searchTerm": query},
+                headers=self.HEADERS,
             )
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             tokens = [self._parse_token(item) for item in data if item]
             return [t for t in tokens if t is not None]
 
@@ -162,15 +206,22 @@ class PumpFunScraper:
             logger.error(f"Search failed: {e}")
             return []
 
+    @staticmethod
+    def _epoch_seconds(created_ts) -> Optional[float]:
+        """Normalize a created_timestamp (seconds or milliseconds) to seconds"""
+        if not isinstance(created_ts, (int, float)):
+            return None
+        # Timestamp in milliseconds
+        if created_ts > 1e12:
+            return created_ts / 1000
+        return created_ts
+
     def _parse_token(self, data: dict) -> Optional[PumpFunToken]:
         """Parse token data from API response"""
         try:
             # Parse timestamp
-            created_ts = data.get("created_timestamp")
-            if isinstance(created_ts, (int, float)):
-                # Timestamp in milliseconds
-                if created_ts > 1e12:
-                    created_ts = created_ts / 1000
+            created_ts = self._epoch_seconds(data.get("created_timestamp"))
+            if created_ts is not None:
                 created_time = datetime.fromtimestamp(created_ts, tz=timezone.utc)
             else:
                 created_time = datetime.now(timezone.utc)
@@ -178,10 +229,10 @@ class PumpFunScraper:
             return PumpFunToken(
                 address=data.get("mint", ""),
                 name=data.get("name", "Unknown"),
-                symbol=data.get("symbol", "???"),
+                symbol=sys.intern(str(data.get("symbol") or "???")),
                 description=data.get("description", ""),
                 image_uri=data.get("image_uri"),
-                creator=data.get("creator", ""),
+                creator=sys.intern(str(data.get("creator") or "")),
                 created_timestamp=created_time,
                 market_cap=float(data.get("usd_market_cap", 0) or 0),
                 reply_count=int(data.get("reply_count", 0) or 0),
@@ -194,5 +245,4 @@ class PumpFunScraper:
             return None
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """No-op: the HTTP client is shared and closed once at shutdown (see _http.close_client)"""
@@ -1,16 +1,42 @@
+import asyncio
 import logging
+import sys
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from dataclasses import dataclass
 
-import httpx
+import orjson
 
 from src.config import settings
+from src.scraper._http import get_client
 
 logger = logging.getLogger(__name__)
 
+# Twitter's classic created_at format, e.g. "Wed Oct 10 20:19:24 +0000 2018"
+TWITTER_TIME_FORMAT = "%a %b %d %H:%M:%S %z %Y"
 
-@dataclass
+# Field names the API uses interchangeably, in order of preference
+RESULTS_KEYS = ("results", "tweets", "data", "statuses")
+ID_KEYS = ("id", "tweet_id", "id_str")
+TEXT_KEYS = ("text", "full_text", "content")
+USER_KEYS = ("user", "author")
+USERNAME_KEYS = ("username", "screen_name")
+FOLLOWERS_KEYS = ("followers_count", "followersCount")
+LIKES_KEYS = ("favorite_count", "likeCount", "likes")
+RETWEETS_KEYS = ("retweet_count", "retweetCount", "retweets")
+CREATED_AT_KEYS = ("created_at", "timestamp", "date")
+
+
+def _first(data: dict, keys: tuple[str, ...], default=None):
+    """First truthy value among keys, like chaining data.get(k) with 'or'"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+@dataclass(slots=True, frozen=True)
 class Tweet:
     """Represents a scraped tweet"""
 
@@ -29,21 +55,37 @@ class TwitterScraper:
 
     BASE_URL = "https://twitterapi-cheap.p.rapidapi.com"
 
+    # Cashtags per search request (keeps the query under the API's length limit)
+    CASHTAG_BATCH_SIZE = 20
+
+    # Pump.fun related cashtags, common terms used when sharing new launches
+    MEMECOIN_CASHTAGS = (
+        "SOL",
+        "SOLANA",
+        "PUMP",
+        "PUMPFUN",
+        "MEMECOIN",
+        "DEGEN",
+        "APE",
+        "GEM",
+    )
+
     def __init__(self):
         self.api_key = settings.rapidapi_key
         self.api_host = settings.rapidapi_host
 
-        if not self.api_key:
-            logger.warning("RapidAPI key not configured. Set RAPIDAPI_KEY in .env")
+        self.client = get_client()
 
-    def _get_headers(self) -> dict:
-        """Get headers for RapidAPI requests"""
-        return {
+        # Fixed for the scraper's lifetime, so built once
+        self.headers = {
             "Content-Type": "application/json",
             "x-rapidapi-host": self.api_host,
             "x-rapidapi-key": self.api_key,
         }
 
+        if not self.api_key:
+            logger.warning("RapidAPI key not configured. Set RAPIDAPI_KEY in .env")
+
     def _get_time_range(self) -> tuple[str, str]:
         """Get time range for the last 24 hours"""
         now = datetime.now(timezone.utc)
@@ -58,9 +100,12 @@ class TwitterScraper:
         """
         Search for tweets mentioning specific cashtags.
 
+        Cashtags are sent CASHTAG_BATCH_SIZE at a time, so a whole token list
+        costs a handful of requests instead of one request per symbol.
+
         Args:
             cashtags: List of cashtags to search (without $)
-            max_items: Maximum tweets to return per cashtag
+            max_items: Maximum tweets to return, split across batches
 
         Returns:
             List of Tweet objects
@@ -69,31 +114,66 @@ class TwitterScraper:
             logger.error("RapidAPI key not configured")
             return []
 
-        start_time, end_time = self._get_time_range()
+        if not cashtags:
+            return []
 
+        start_time, end_time = self._get_time_range()
+        semaphore = asyncio.Semaphore(settings.twitter_concurrency)
+
+        async def search_batch(batch: list[str]) -> list[Tweet]:
+            batch_max_items = max(1, max_items * len(batch) // len(cashtags))
+            async with semaphore:
+                return await self._search_cashtag_batch(batch, batch_max_items, start_time, end_time)
+
+        # Run batches concurrently, bounded by the RapidAPI concurrency budget
+        results = await asyncio.gather(*(
+            search_batch(cashtags[i:i + self.CASHTAG_BATCH_SIZE])
+            for i in range(0, len(cashtags), self.CASHTAG_BATCH_SIZE)
+        ))
+
+        # Batches can return the same tweet; keep each one's first occurrence
+        # and only parse those
+        by_id = {}
+        for batch_results in results:
+            for tweet_data in batch_results:
+                if type(tweet_data) is dict:
+                    by_id.setdefault(self._raw_tweet_id(tweet_data), tweet_data)
+        by_id.pop("", None)
+
+        tweets = [self._parse_tweet(tweet_data) for tweet_data in by_id.values()]
+        return [tweet for tweet in tweets if tweet]
+
+    async def _search_cashtag_batch(
+        self,
+        cashtags: list[str],
+        max_items: int,
+        start_time: str,
+        end_time: str,
+    ) -> list[dict]:
+        """Run a single cashtag search request, returning the raw tweet dicts"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/twitter/cashtags",
-                    headers=self._get_headers(),
-                    json={
-                        "cashtags": cashtags,
-                        "startTime": start_time,
-                        "endTime": end_time,
-                        "sortBy": "Latest",
-                        "maxItems": max_items,
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"API error: {response.status_code} - {response.text[:200]}")
-                    return []
-
-                data = response.json()
-                logger.debug(f"API response: {data}")
-                tweets = self._parse_cashtag_response(data)
-                logger.info(f"Found {len(tweets)} tweets for cashtags: {cashtags}")
-                return tweets
+            response = await self.client.post(
+                f"{self.BASE_URL}/twitter/cashtags",
+                headers=self.headers,
+                json={
+                    "cashtags": cashtags,
+                    "startTime": start_time,
+                    "endTime": end_time,
+                    "sortBy": "Latest",
+                    "maxItems": max_items,
+                },
+            )
+
+            if response.status_code != 200:
+                logger.error(f"API error: {response.status_code} - {response.text[:200]}")
+                return []
+
+            data = orjson.loads(response.content)
+            # Lazy %-formatting: repr-ing the whole response is only paid with DEBUG on
+            logger.debug("API response: %s", data)
+            results = self._cashtag_results(data)
+            logger.info(f"Found {len(results)} tweets for cashtags: {cashtags}")
+            return results
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -117,122 +197,113 @@ class TwitterScraper:
         start_time, end_time = self._get_time_range()
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/twitter/search",
-                    headers=self._get_headers(),
-                    json={
-                        "query": keyword,
-                        "startTime": start_time,
-                        "endTime": end_time,
-                        "sortBy": "Latest",
-                        "maxItems": max_items,
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"API error: {response.status_code} - {response.text[:200]}")
-                    return []
-
-                data = response.json()
-                tweets = self._parse_search_response(data)
-                logger.info(f"Found {len(tweets)} tweets for keyword: {keyword}")
-                return tweets
+            response = await self.client.post(
+                f"{self.BASE_URL}/twitter/search",
+                headers=self.headers,
+                json={
+                    "query": keyword,
+                    "startTime": start_time,
+                    "endTime": end_time,
+                    "sortBy": "Latest",
+                    "maxItems": max_items,
+                },
+            )
+
+            if response.status_code != 200:
+                logger.error(f"API error: {response.status_code} - {response.text[:200]}")
+                return []
+
+            data = orjson.loads(response.content)
+            tweets = self._parse_search_response(data)
+            logger.info(f"Found {len(tweets)} tweets for keyword: {keyword}")
+            return tweets
 
         except Exception as e:
             logger.error(f"Search failed for '{keyword}': {e}")
             return []
 
-    def _parse_cashtag_response(self, data) -> list[Tweet]:
-        """Parse cashtag API response"""
-        tweets = []
-
+    def _cashtag_results(self, data) -> list:
+        """Pull the raw tweet list out of a cashtag API response"""
         # Log the response structure for debugging
-        logger.info(f"API response type: {type(data)}, keys: {data.keys() if isinstance(data, dict) else 'N/A'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"API response type: {type(data)}, keys: {data.keys() if type(data) is dict else 'N/A'}")
 
-        # Handle different response structures
-        if isinstance(data, list):
+        # Handle different response structures (orjson only produces exact
+        # dicts and lists, so plain type checks suffice)
+        if type(data) is list:
             results = data
-        elif isinstance(data, dict):
+        elif type(data) is dict:
             # Try various possible keys
-            results = (
-                data.get("results") or
-                data.get("tweets") or
-                data.get("data") or
-                data.get("statuses") or
-                []
-            )
+            results = _first(data, RESULTS_KEYS, [])
 
             # If results is still a dict (keyed by cashtag), flatten it
-            if isinstance(results, dict):
+            if type(results) is dict:
                 flattened = []
                 for key, value in results.items():
-                    if isinstance(value, list):
+                    if type(value) is list:
                         flattened.extend(value)
-                    elif isinstance(value, dict) and "tweets" in value:
+                    elif type(value) is dict and "tweets" in value:
                         flattened.extend(value["tweets"])
                 results = flattened
         else:
             results = []
 
-        logger.info(f"Parsing {len(results) if isinstance(results, list) else 0} results")
-
-        if isinstance(results, list):
-            for tweet_data in results:
-                tweet = self._parse_tweet(tweet_data)
-                if tweet:
-                    tweets.append(tweet)
-
-        return tweets
+        return results if type(results) is list else []
 
     def _parse_search_response(self, data: dict) -> list[Tweet]:
         """Parse search API response"""
-        tweets = []
+        results = data if type(data) is list else data.get("results", data.get("tweets", []))
 
-        results = data if isinstance(data, list) else data.get("results", data.get("tweets", []))
+        if type(results) is not list:
+            return []
 
-        if isinstance(results, list):
-            for tweet_data in results:
-                tweet = self._parse_tweet(tweet_data)
-                if tweet:
-                    tweets.append(tweet)
+        tweets = [self._parse_tweet(tweet_data) for tweet_data in results]
+        return [tweet for tweet in tweets if tweet]
 
-        return tweets
+    @staticmethod
+    def _raw_tweet_id(tweet_data: dict) -> str:
+        """Tweet ID from a raw API tweet, under whichever field name it uses ("" if none)"""
+        tweet_id = _first(tweet_data, ID_KEYS)
+        # Check before str(), which would turn a null id_str into "None"
+        return str(tweet_id) if tweet_id else ""
 
     def _parse_tweet(self, tweet_data: dict) -> Optional[Tweet]:
         """Parse individual tweet from API response"""
         try:
-            # Handle various field names from API
-            tweet_id = str(tweet_data.get("id") or tweet_data.get("tweet_id") or tweet_data.get("id_str", ""))
+            tweet_id = self._raw_tweet_id(tweet_data)
 
             if not tweet_id:
                 return None
 
-            text = tweet_data.get("text") or tweet_data.get("full_text") or tweet_data.get("content", "")
+            text = _first(tweet_data, TEXT_KEYS, "")
 
             # Get author info
-            user = tweet_data.get("user") or tweet_data.get("author") or {}
-            username = user.get("username") or user.get("screen_name") or tweet_data.get("username", "unknown")
-            followers = user.get("followers_count") or user.get("followersCount", 0)
+            user = _first(tweet_data, USER_KEYS, {})
+            # Interned: the same authors recur across a scrape
+            username = sys.intern(str(_first(user, USERNAME_KEYS) or tweet_data.get("username") or "unknown"))
+            followers = _first(user, FOLLOWERS_KEYS, 0)
 
             # Get engagement
-            likes = tweet_data.get("favorite_count") or tweet_data.get("likeCount") or tweet_data.get("likes", 0)
-            retweets = tweet_data.get("retweet_count") or tweet_data.get("retweetCount") or tweet_data.get("retweets", 0)
+            likes = _first(tweet_data, LIKES_KEYS, 0)
+            retweets = _first(tweet_data, RETWEETS_KEYS, 0)
 
             # Parse timestamp
-            created_at = tweet_data.get("created_at") or tweet_data.get("timestamp") or tweet_data.get("date")
-            if isinstance(created_at, str):
+            created_at = _first(tweet_data, CREATED_AT_KEYS)
+            if type(created_at) in (int, float):
+                # Epoch timestamp, which some endpoints give in milliseconds
+                if created_at > 1e12:
+                    created_at = created_at / 1000
+                timestamp = datetime.fromtimestamp(created_at, tz=timezone.utc)
+            elif isinstance(created_at, str):
                 try:
-                    # Try ISO format
-                    timestamp = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                    if created_at[:1].isdigit():
+                        # ISO format
+                        timestamp = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                    else:
+                        # Twitter format, which starts with the weekday name
+                        timestamp = datetime.strptime(created_at, TWITTER_TIME_FORMAT)
                 except ValueError:
-                    try:
-                        # Try Twitter format
-                        timestamp = datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
-                    except ValueError:
-                        timestamp = datetime.now(timezone.utc)
-            elif isinstance(created_at, (int, float)):
-                timestamp = datetime.fromtimestamp(created_at, tz=timezone.utc)
+                    timestamp = datetime.now(timezone.utc)
             else:
                 timestamp = datetime.now(timezone.utc)
 
@@ -256,27 +327,11 @@ class TwitterScraper:
 
         Returns combined results from multiple searches.
         """
-        all_tweets = []
-        seen_ids = set()
-
-        # Search for pump.fun related cashtags
-        # These are common terms used when sharing new pump.fun launches
-        cashtags = [
-            "SOL",
-            "SOLANA",
-            "PUMP",
-            "PUMPFUN",
-            "MEMECOIN",
-            "DEGEN",
-            "APE",
-            "GEM",
-        ]
-
-        cashtag_tweets = await self.search_cashtags(cashtags, max_items=max_results)
-        for tweet in cashtag_tweets:
-            if tweet.tweet_id not in seen_ids:
-                seen_ids.add(tweet.tweet_id)
-                all_tweets.append(tweet)
+        # search_cashtags already drops tweets repeated across batches
+        all_tweets = await self.search_cashtags(list(self.MEMECOIN_CASHTAGS), max_items=max_results)
 
         logger.info(f"Total tweets collected: {len(all_tweets)}")
         return all_tweets
+
+    async def close(self):
+        """No-op: the HTTP client is shared and closed once at shutdown (see _http.close_client)"""